@@ -1,17 +1,13 @@
-from typing import Annotated
+from fastapi import APIRouter
 
-from fastapi import APIRouter, Depends
-
-from app.utils.auth_dependencies import get_current_user
-from app.schemas import UserInfo, UserResponse
+from app.schemas import UserResponse
+from app.utils.auth_dependencies import CurrentUser
 
 router = APIRouter()
 
 
 @router.get("/me", response_model=UserResponse)
-async def get_current_user_info(
-    current_user: Annotated[UserInfo, Depends(get_current_user)]
-) -> UserResponse:
+async def get_current_user_info(current_user: CurrentUser) -> UserResponse:
     return UserResponse(
         user_id=current_user.user_id,
         auth0_id=current_user.auth0_id,
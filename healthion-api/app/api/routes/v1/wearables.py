@@ -5,19 +5,28 @@ Handles OAuth flows, provider management, and data synchronization
 with wearable devices (Garmin, Polar, Suunto).
 """
 
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from typing import Annotated
+from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+import xxhash
+from cachetools import TTLCache
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel
 
 from app.database import DbSession
 from app.models import User
-from app.schemas import UserInfo
 from app.schemas.wearables import (
     ActivitySummaryResponse,
+    AllSummariesResponse,
     AppleHealthImportResponse,
     AuthorizationResponse,
     AvailableSeriesTypesResponse,
     BodySummaryResponse,
+    BootstrapResponse,
     ConnectionsResponse,
     DateRangeQueryParams,
     EventWorkoutsQueryParams,
@@ -36,14 +45,77 @@ from app.schemas.wearables import (
     WorkoutsResponse,
 )
 from app.services import wearables_service
-from app.utils.auth_dependencies import get_current_user
+from app.utils.api_utils import ORJSONRoute
+from app.utils.auth_dependencies import CurrentUser
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse, route_class=ORJSONRoute)
 
+# Query-parameter models as reusable dependencies, like DbSession and CurrentUser
+ProvidersQuery = Annotated[ProvidersQueryParams, Depends()]
+TimeseriesQuery = Annotated[TimeseriesQueryParams, Depends()]
+DateRangeQuery = Annotated[DateRangeQueryParams, Depends()]
+EventWorkoutsQuery = Annotated[EventWorkoutsQueryParams, Depends()]
 
-def _get_user_or_404(db: DbSession, user_id) -> User:
+# Summaries are revalidated on every request: syncs pull days back and Apple
+# Health imports backfill any history, so even ranges in the past still change
+_SUMMARY_CACHE_CONTROL = "private, no-cache"
+
+# Serialized bodies of recently returned models, keyed by identity so responses
+# served from the service's cache are not re-serialized; the entry holds the
+# model itself so its id cannot be reused while the entry is alive
+_body_cache: TTLCache[int, tuple[BaseModel, bytes, str]] = TTLCache(maxsize=512, ttl=60)
+
+# Long-running upstream jobs (sync, Apple Health import) admitted at once per
+# worker; excess requests wait for a slot instead of piling onto Open Wearables
+_upstream_jobs = asyncio.Semaphore(8)
+_UPSTREAM_JOB_WAIT_SECONDS = 30
+
+
+@asynccontextmanager
+async def _upstream_job_slot() -> AsyncIterator[None]:
+    """Hold one upstream job slot, or raise 503 if none frees up in time."""
+    try:
+        async with asyncio.timeout(_UPSTREAM_JOB_WAIT_SECONDS):
+            await _upstream_jobs.acquire()
+    except TimeoutError:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Too many sync or import jobs in progress. Try again later.",
+            headers={"Retry-After": str(_UPSTREAM_JOB_WAIT_SECONDS)},
+        ) from None
+    try:
+        yield
+    finally:
+        _upstream_jobs.release()
+
+
+def _etag(body: bytes) -> str:
+    """Strong ETag for a response body."""
+    return f'"{xxhash.xxh3_128_hexdigest(body)}"'
+
+
+def _serialize(model: BaseModel) -> tuple[bytes, str]:
+    """JSON body and ETag of a model, reused while the service keeps returning the same instance."""
+    if (entry := _body_cache.get(id(model))) is not None and entry[0] is model:
+        return entry[1], entry[2]
+    body = model.model_dump_json().encode()
+    etag = _etag(body)
+    _body_cache[id(model)] = (model, body, etag)
+    return body, etag
+
+
+def _conditional_response(request: Request, model: BaseModel, cache_control: str) -> Response:
+    """Serialize a model with Cache-Control and ETag, answering 304 when the client's copy is current."""
+    body, etag = _serialize(model)
+    headers = {"Cache-Control": cache_control, "ETag": etag}
+    if request.headers.get("if-none-match") == headers["ETag"]:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+async def _get_user_or_404(db: DbSession, user_id: UUID) -> User:
     """Get user by ID or raise 404."""
-    user = wearables_service.get_user_by_id(db, user_id)
+    user = await wearables_service.get_user_by_id(db, user_id)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -54,141 +126,94 @@ def _get_user_or_404(db: DbSession, user_id) -> User:
 
 @router.post("/register", response_model=RegisterOpenWearablesResponse)
 async def register_with_open_wearables(
-    current_user: Annotated[UserInfo, Depends(get_current_user)],
+    current_user: CurrentUser,
     db: DbSession,
 ) -> RegisterOpenWearablesResponse:
     """Register current user with Open Wearables platform."""
-    user = _get_user_or_404(db, current_user.user_id)
+    user = await _get_user_or_404(db, current_user.user_id)
     
-    try:
-        return await wearables_service.register_user(db, user)
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_502_BAD_GATEWAY,
-            detail=f"Failed to register with Open Wearables: {str(e)}"
-        )
+    return await wearables_service.register_user(db, user)
 
 
 @router.get("/providers", response_model=ProvidersResponse)
 async def get_providers(
-    current_user: Annotated[UserInfo, Depends(get_current_user)],
-    query_params: ProvidersQueryParams = Depends(),
-) -> ProvidersResponse:
+    request: Request,
+    current_user: CurrentUser,
+    query_params: ProvidersQuery,
+) -> Response:
     """Get list of available wearable providers."""
-    try:
-        return await wearables_service.get_providers(query_params)
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_502_BAD_GATEWAY,
-            detail=f"Failed to fetch providers: {str(e)}"
-        )
+    providers = await wearables_service.get_providers(query_params)
+    return _conditional_response(request, providers, "public, max-age=3600")
 
 
 @router.get("/authorize/{provider}", response_model=AuthorizationResponse)
 async def authorize_provider(
     provider: str,
-    current_user: Annotated[UserInfo, Depends(get_current_user)],
+    current_user: CurrentUser,
     db: DbSession,
     redirect_uri: str | None = Query(None, description="Custom redirect URI"),
 ) -> AuthorizationResponse:
     """Initiate OAuth flow for a wearable provider."""
-    user = _get_user_or_404(db, current_user.user_id)
+    user = await _get_user_or_404(db, current_user.user_id)
     
-    try:
-        return await wearables_service.get_authorization_url(
-            db, user, provider, redirect_uri
-        )
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_502_BAD_GATEWAY,
-            detail=f"Failed to get authorization URL: {str(e)}"
-        )
+    return await wearables_service.get_authorization_url(
+        db, user, provider, redirect_uri,
+    )
 
 
 @router.get("/connections", response_model=ConnectionsResponse)
 async def get_connections(
-    current_user: Annotated[UserInfo, Depends(get_current_user)],
-    db: DbSession,
+    current_user: CurrentUser,
 ) -> ConnectionsResponse:
     """Get all wearable provider connections for the current user."""
-    user = _get_user_or_404(db, current_user.user_id)
-    
-    try:
-        return await wearables_service.get_connections(user)
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_502_BAD_GATEWAY,
-            detail=f"Failed to fetch connections: {str(e)}"
-        )
+    return await wearables_service.get_connections(current_user.open_wearables_user_id)
+
+
+@router.get("/bootstrap")
+async def get_bootstrap(
+    current_user: CurrentUser,
+    query_params: ProvidersQuery,
+) -> BootstrapResponse:
+    """Get available providers and the current user's connections in one call."""
+    return await wearables_service.get_bootstrap(current_user.open_wearables_user_id, query_params)
 
 
 @router.get("/timeseries", response_model=TimeseriesResponse)
 async def get_timeseries(
-    current_user: Annotated[UserInfo, Depends(get_current_user)],
-    db: DbSession,
-    query_params: TimeseriesQueryParams = Depends(),
-) -> TimeseriesResponse:
+    request: Request,
+    current_user: CurrentUser,
+    query_params: TimeseriesQuery,
+) -> Response:
     """Get time series data (heart rate, steps, HRV) from Open Wearables."""
-    user = _get_user_or_404(db, current_user.user_id)
-    
-    try:
-        return await wearables_service.get_timeseries(
-            user, current_user.user_id, query_params
-        )
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_502_BAD_GATEWAY,
-            detail=f"Failed to fetch timeseries: {str(e)}"
-        )
+    timeseries = await wearables_service.get_timeseries(
+        current_user.open_wearables_user_id, current_user.user_id, query_params,
+    )
+    return _conditional_response(request, timeseries, "private, no-cache")
 
 
 @router.post("/sync", response_model=SyncResponse)
 async def sync_data(
     sync_request: SyncRequest,
-    current_user: Annotated[UserInfo, Depends(get_current_user)],
+    current_user: CurrentUser,
     db: DbSession,
 ) -> SyncResponse:
     """Trigger data synchronization from a wearable provider."""
-    user = _get_user_or_404(db, current_user.user_id)
-    
-    if not user.open_wearables_user_id:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="User not registered with Open Wearables"
-        )
+    ow_user_id = (
+        current_user.open_wearables_user_id
+        or await wearables_service.get_open_wearables_id_or_404(db, current_user.user_id)
+    )
     
-    try:
-        return await wearables_service.sync_data(user, sync_request)
-    except Exception as e:
-        error_msg = str(e)
-        if "already exists" in error_msg or "UniqueViolation" in error_msg:
-            return SyncResponse(
-                status="success",
-                message="Data already synced - no new data to import",
-                synced_count=0,
-            )
-        raise HTTPException(
-            status_code=status.HTTP_502_BAD_GATEWAY,
-            detail=f"Failed to sync data: {error_msg}"
-        )
+    async with _upstream_job_slot():
+        return await wearables_service.sync_data(ow_user_id, sync_request)
 
 
 @router.get("/workouts", response_model=WorkoutsResponse)
 async def get_workouts(
-    current_user: Annotated[UserInfo, Depends(get_current_user)],
-    db: DbSession,
+    current_user: CurrentUser,
     limit: int = Query(50, ge=1, le=100, description="Max results"),
 ) -> WorkoutsResponse:
     """Get workouts from Open Wearables."""
-    user = _get_user_or_404(db, current_user.user_id)
-    
-    try:
-        return await wearables_service.get_workouts(user, limit)
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_502_BAD_GATEWAY,
-            detail=f"Failed to fetch workouts: {str(e)}"
-        )
+    return await wearables_service.get_workouts(current_user.open_wearables_user_id, limit)
 
 
 # ============================================
@@ -197,38 +222,20 @@ async def get_workouts(
 
 @router.get("/events/workouts", response_model=EventWorkoutsResponse)
 async def get_event_workouts(
-    current_user: Annotated[UserInfo, Depends(get_current_user)],
-    db: DbSession,
-    query_params: EventWorkoutsQueryParams = Depends(),
+    current_user: CurrentUser,
+    query_params: EventWorkoutsQuery,
 ) -> EventWorkoutsResponse:
     """Get rich workout events with calories, distance, heart rate data."""
-    user = _get_user_or_404(db, current_user.user_id)
-    
-    try:
-        return await wearables_service.get_event_workouts(user, query_params)
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_502_BAD_GATEWAY,
-            detail=f"Failed to fetch workouts: {str(e)}"
-        )
+    return await wearables_service.get_event_workouts(current_user.open_wearables_user_id, query_params)
 
 
 @router.get("/events/sleep", response_model=SleepSessionsResponse)
 async def get_sleep_sessions(
-    current_user: Annotated[UserInfo, Depends(get_current_user)],
-    db: DbSession,
-    query_params: DateRangeQueryParams = Depends(),
+    current_user: CurrentUser,
+    query_params: DateRangeQuery,
 ) -> SleepSessionsResponse:
     """Get sleep sessions with stage breakdown (awake, light, deep, REM)."""
-    user = _get_user_or_404(db, current_user.user_id)
-    
-    try:
-        return await wearables_service.get_sleep_sessions(user, query_params)
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_502_BAD_GATEWAY,
-            detail=f"Failed to fetch sleep sessions: {str(e)}"
-        )
+    return await wearables_service.get_sleep_sessions(current_user.open_wearables_user_id, query_params)
 
 
 # ============================================
@@ -237,74 +244,59 @@ async def get_sleep_sessions(
 
 @router.get("/summaries/activity", response_model=ActivitySummaryResponse)
 async def get_activity_summary(
-    current_user: Annotated[UserInfo, Depends(get_current_user)],
-    db: DbSession,
-    query_params: DateRangeQueryParams = Depends(),
-) -> ActivitySummaryResponse:
+    request: Request,
+    current_user: CurrentUser,
+    query_params: DateRangeQuery,
+) -> Response:
     """Get daily activity summaries: steps, calories, distance, active time."""
-    user = _get_user_or_404(db, current_user.user_id)
-    
-    try:
-        return await wearables_service.get_activity_summary(user, query_params)
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_502_BAD_GATEWAY,
-            detail=f"Failed to fetch activity summary: {str(e)}"
-        )
+    summary = await wearables_service.get_activity_summary(current_user.open_wearables_user_id, query_params)
+    return _conditional_response(request, summary, _SUMMARY_CACHE_CONTROL)
 
 
 @router.get("/summaries/sleep", response_model=SleepSummaryResponse)
 async def get_sleep_summary(
-    current_user: Annotated[UserInfo, Depends(get_current_user)],
-    db: DbSession,
-    query_params: DateRangeQueryParams = Depends(),
-) -> SleepSummaryResponse:
+    request: Request,
+    current_user: CurrentUser,
+    query_params: DateRangeQuery,
+) -> Response:
     """Get daily sleep summaries: duration, efficiency, stages, HRV."""
-    user = _get_user_or_404(db, current_user.user_id)
-    
-    try:
-        return await wearables_service.get_sleep_summary(user, query_params)
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_502_BAD_GATEWAY,
-            detail=f"Failed to fetch sleep summary: {str(e)}"
-        )
+    summary = await wearables_service.get_sleep_summary(current_user.open_wearables_user_id, query_params)
+    return _conditional_response(request, summary, _SUMMARY_CACHE_CONTROL)
 
 
 @router.get("/summaries/recovery", response_model=RecoverySummaryResponse)
 async def get_recovery_summary(
-    current_user: Annotated[UserInfo, Depends(get_current_user)],
-    db: DbSession,
-    query_params: DateRangeQueryParams = Depends(),
-) -> RecoverySummaryResponse:
+    request: Request,
+    current_user: CurrentUser,
+    query_params: DateRangeQuery,
+) -> Response:
     """Get daily recovery summaries: recovery score, HRV, resting HR."""
-    user = _get_user_or_404(db, current_user.user_id)
-    
-    try:
-        return await wearables_service.get_recovery_summary(user, query_params)
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_502_BAD_GATEWAY,
-            detail=f"Failed to fetch recovery summary: {str(e)}"
-        )
+    summary = await wearables_service.get_recovery_summary(current_user.open_wearables_user_id, query_params)
+    return _conditional_response(request, summary, _SUMMARY_CACHE_CONTROL)
 
 
 @router.get("/summaries/body", response_model=BodySummaryResponse)
 async def get_body_summary(
-    current_user: Annotated[UserInfo, Depends(get_current_user)],
-    db: DbSession,
-    query_params: DateRangeQueryParams = Depends(),
-) -> BodySummaryResponse:
+    request: Request,
+    current_user: CurrentUser,
+    query_params: DateRangeQuery,
+) -> Response:
     """Get daily body metrics: weight, body fat, BMI, resting HR, HRV, blood pressure."""
-    user = _get_user_or_404(db, current_user.user_id)
-    
-    try:
-        return await wearables_service.get_body_summary(user, query_params)
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_502_BAD_GATEWAY,
-            detail=f"Failed to fetch body summary: {str(e)}"
-        )
+    summary = await wearables_service.get_body_summary(current_user.open_wearables_user_id, query_params)
+    return _conditional_response(request, summary, _SUMMARY_CACHE_CONTROL)
+
+
+@router.get("/summaries", response_model=AllSummariesResponse)
+async def get_all_summaries(
+    request: Request,
+    current_user: CurrentUser,
+    query_params: DateRangeQuery,
+) -> Response:
+    """Get activity, sleep, recovery and body summaries for a date range in one call."""
+    summaries = await wearables_service.get_all_summaries(current_user.open_wearables_user_id, query_params)
+    # A part that failed to load is null; don't let clients keep the partial body
+    partial = None in (summaries.activity, summaries.sleep, summaries.recovery, summaries.body)
+    return _conditional_response(request, summaries, "no-store" if partial else _SUMMARY_CACHE_CONTROL)
 
 
 # ============================================
@@ -315,30 +307,21 @@ async def get_body_summary(
 async def get_workout_detail(
     provider: str,
     workout_id: str,
-    current_user: Annotated[UserInfo, Depends(get_current_user)],
+    current_user: CurrentUser,
     db: DbSession,
 ) -> WorkoutDetailResponse:
     """Get detailed data for a single workout from a specific provider."""
-    user = _get_user_or_404(db, current_user.user_id)
-    
-    if not user.open_wearables_user_id:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="User not registered with Open Wearables"
-        )
+    ow_user_id = (
+        current_user.open_wearables_user_id
+        or await wearables_service.get_open_wearables_id_or_404(db, current_user.user_id)
+    )
     
-    try:
-        return await wearables_service.get_workout_detail(user, provider, workout_id)
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_502_BAD_GATEWAY,
-            detail=f"Failed to fetch workout detail: {str(e)}"
-        )
+    return await wearables_service.get_workout_detail(ow_user_id, provider, workout_id)
 
 
 @router.post("/import/apple-health", response_model=AppleHealthImportResponse)
 async def import_apple_health(
-    current_user: Annotated[UserInfo, Depends(get_current_user)],
+    current_user: CurrentUser,
     db: DbSession,
     file_key: str = Query(..., description="S3 file key from presigned upload"),
 ) -> AppleHealthImportResponse:
@@ -350,31 +333,34 @@ async def import_apple_health(
     2. Upload the export.xml file to the presigned URL
     3. Call this endpoint with the file_key to process the import
     """
-    user = _get_user_or_404(db, current_user.user_id)
-    
-    if not user.open_wearables_user_id:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="User not registered with Open Wearables"
-        )
+    ow_user_id = current_user.open_wearables_user_id
+    if not ow_user_id:
+        # Importing needs an Open Wearables user; register on demand like /authorize
+        user = await _get_user_or_404(db, current_user.user_id)
+        registration = await wearables_service.register_user(db, user)
+        ow_user_id = registration.open_wearables_user_id
     
-    try:
-        return await wearables_service.import_apple_health_xml(user, file_key)
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_502_BAD_GATEWAY,
-            detail=f"Failed to import Apple Health data: {str(e)}"
-        )
+    async with _upstream_job_slot():
+        return await wearables_service.import_apple_health_xml(ow_user_id, file_key)
 
 
 # ============================================
 # Metadata Endpoints
 # ============================================
 
+# The series type catalogue is static, so serialize it once at import time
+_SERIES_TYPES_JSON = wearables_service.get_available_series_types().model_dump_json().encode()
+_SERIES_TYPES_HEADERS = {
+    "Cache-Control": "public, max-age=86400",
+    "ETag": _etag(_SERIES_TYPES_JSON),
+}
+
+
 @router.get("/series-types", response_model=AvailableSeriesTypesResponse)
 async def get_available_series_types(
-    current_user: Annotated[UserInfo, Depends(get_current_user)],
-) -> AvailableSeriesTypesResponse:
+    request: Request,
+    current_user: CurrentUser,
+) -> Response:
     """
     Get list of all available timeseries types.
     
@@ -392,4 +378,10 @@ async def get_available_series_types(
     - cycling: cadence, power
     - environment: audio_exposure, daylight, water_temperature
     """
-    return wearables_service.get_available_series_types()
+    if request.headers.get("if-none-match") == _SERIES_TYPES_HEADERS["ETag"]:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=_SERIES_TYPES_HEADERS)
+    return Response(
+        content=_SERIES_TYPES_JSON,
+        media_type="application/json",
+        headers=_SERIES_TYPES_HEADERS,
+    )
@@ -40,6 +40,11 @@ class Settings(BaseSettings):
     db_name: str = "healthion-api"
     db_user: str = "user"
     db_password: SecretStr = SecretStr("password")
+    # Per process: every gunicorn worker opens up to pool_size + max_overflow connections,
+    # so 10 each keeps one worker per core under Postgres' default max_connections=100
+    db_pool_size: int = 5
+    db_max_overflow: int = 5
+    db_pool_recycle: int = 1800
 
     # AUTH0 SETTINGS
     auth0_domain: str = ""
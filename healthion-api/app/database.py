@@ -3,7 +3,7 @@ from collections.abc import Iterator
 from uuid import UUID
 
 from fastapi import Depends
-from sqlalchemy import Engine, UUID as SqlUUID, Text, create_engine, inspect
+from sqlalchemy import Engine, MetaData, Text, Uuid, create_engine, inspect
 from sqlalchemy.orm import (
     DeclarativeBase,
     Session,
@@ -17,10 +17,10 @@ from app.utils.mappings_meta import AutoRelMeta
 engine = create_engine(
     settings.db_uri,
     pool_pre_ping=True,
-    pool_size=20,
-    max_overflow=30,
+    pool_size=settings.db_pool_size,
+    max_overflow=settings.db_max_overflow,
     pool_timeout=30,
-    pool_recycle=3600,
+    pool_recycle=settings.db_pool_recycle,
 )
 
 
@@ -28,6 +28,17 @@ def _prepare_sessionmaker(engine: Engine) -> sessionmaker:
     return sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 class BaseDbModel(DeclarativeBase, metaclass=AutoRelMeta):    
+    # Matches the names PostgreSQL gave the constraints created in 001_init,
+    # so autogenerate derives the same names instead of renaming them
+    metadata = MetaData(
+        naming_convention={
+            "ix": "ix_%(column_0_label)s",
+            "uq": "%(table_name)s_%(column_0_name)s_key",
+            "fk": "%(table_name)s_%(column_0_name)s_fkey",
+            "pk": "%(table_name)s_pkey",
+        },
+    )
+
     @declared_attr
     def __tablename__(self) -> str:
         return self.__name__.lower()
@@ -46,7 +57,7 @@ class BaseDbModel(DeclarativeBase, metaclass=AutoRelMeta):
 
     type_annotation_map = {
         str: Text,
-        UUID: SqlUUID,
+        UUID: Uuid,
     }
 
 
@@ -54,6 +65,20 @@ class BaseDbModel(DeclarativeBase, metaclass=AutoRelMeta):
 SessionLocal = _prepare_sessionmaker(engine)
 
 
+def commit_keeping_loaded(db_session: Session) -> None:
+    """Commit without expiring loaded instances.
+
+    Only for writes whose RETURNING values were already applied to their
+    instances; every other commit keeps the session's expire_on_commit.
+    """
+    expire_on_commit = db_session.expire_on_commit
+    db_session.expire_on_commit = False
+    try:
+        db_session.commit()
+    finally:
+        db_session.expire_on_commit = expire_on_commit
+
+
 def _get_db_dependency() -> Iterator[Session]:
     from logging import getLogger
     logger = getLogger(__name__)
@@ -1,16 +1,34 @@
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager, suppress
 from logging import INFO, basicConfig
 
 from fastapi import FastAPI, Request
 from fastapi.exceptions import RequestValidationError
+from sqlalchemy.orm.exc import StaleDataError
 
-from app.config import settings
-from app.utils.exceptions import handle_exception
 from app.api import head_router
+from app.config import settings
 from app.middlewares import add_cors_middleware
+from app.services.open_wearables_client import open_wearables_client
+from app.utils.exceptions import UpstreamError, handle_exception
 
 basicConfig(level=INFO, format="[%(asctime)s - %(name)s] (%(levelname)s) %(message)s")
 
-api = FastAPI(title=settings.api_name)
+
+@asynccontextmanager
+async def lifespan(_: FastAPI) -> AsyncIterator[None]:
+    # Connect to Open Wearables in the background so startup is not held up
+    warm_up = asyncio.create_task(open_wearables_client.warm_up())
+    yield
+    # Stop an unfinished warm-up before its connections are closed
+    warm_up.cancel()
+    with suppress(asyncio.CancelledError):
+        await warm_up
+    await open_wearables_client.aclose()
+
+
+api = FastAPI(title=settings.api_name, lifespan=lifespan)
 
 api.include_router(head_router)
 
@@ -28,3 +46,13 @@ async def request_validation_exception_handler(
 ) -> None:
     raise handle_exception(exc, "request_validation")
 
+
+
+@api.exception_handler(UpstreamError)
+async def upstream_exception_handler(_: Request, exc: UpstreamError) -> None:
+    raise handle_exception(exc, "upstream")
+
+
+@api.exception_handler(StaleDataError)
+async def stale_data_exception_handler(_: Request, exc: StaleDataError) -> None:
+    raise handle_exception(exc, "user")
@@ -1,5 +1,6 @@
 from uuid import UUID
 
+from sqlalchemy import Index, func, text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.database import BaseDbModel
@@ -7,9 +8,24 @@ from app.mappings import PrimaryKey, Unique, datetime_tz, email
 
 
 class User(BaseDbModel):
-    id: Mapped[PrimaryKey[UUID]]
+    id: Mapped[PrimaryKey[UUID]] = mapped_column(server_default=func.gen_random_uuid())
     auth0_id: Mapped[Unique[str]]
     email: Mapped[Unique[email]]
     open_wearables_user_id: Mapped[UUID | None] = mapped_column()
-    created_at: Mapped[datetime_tz]
-    updated_at: Mapped[datetime_tz]
+    created_at: Mapped[datetime_tz] = mapped_column(server_default=func.now())
+    updated_at: Mapped[datetime_tz] = mapped_column(server_default=func.now())
+    # Bumped on every write; stale ORM updates fail instead of silently overwriting
+    version: Mapped[int] = mapped_column(default=0, server_default="0")
+
+    __mapper_args__ = {"version_id_col": version}
+    __table_args__ = (
+        # One account per Open Wearables user; unregistered users stay out of the index.
+        # Named explicitly: the "ix" convention would reuse the name of the plain
+        # index this one replaced in revision 003.
+        Index(
+            "uq_user_open_wearables_user_id",
+            "open_wearables_user_id",
+            unique=True,
+            postgresql_where=text("open_wearables_user_id IS NOT NULL"),
+        ),
+    )
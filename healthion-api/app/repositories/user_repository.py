@@ -1,4 +1,7 @@
-from app.database import DbSession
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
+
+from app.database import DbSession, commit_keeping_loaded
 from app.models import User
 from app.repositories import CrudRepository
 from app.schemas import UserCreate, UserUpdate
@@ -9,5 +12,28 @@ class UserRepository(CrudRepository[User, UserCreate, UserUpdate]):
         super().__init__(model)
 
     def get_user_by_auth0_id(self, db_session: DbSession, auth0_id: str) -> User | None:
-        return db_session.query(self.model).filter(self.model.auth0_id == auth0_id).one_or_none()
+        return db_session.scalars(
+            select(self.model).where(self.model.auth0_id == auth0_id),
+        ).one_or_none()
 
+    def upsert_user(self, db_session: DbSession, creator: UserCreate) -> User:
+        """Insert the user, or update its email if the auth0_id exists, in one statement."""
+        stmt = insert(self.model).values(**creator.model_dump())
+        stmt = (
+            stmt.on_conflict_do_update(
+                index_elements=[self.model.auth0_id],
+                set_={
+                    "email": stmt.excluded.email,
+                    "updated_at": stmt.excluded.updated_at,
+                    "version": self.model.version + 1,
+                },
+                where=self.model.email != stmt.excluded.email,
+            )
+            .returning(self.model)
+            .execution_options(populate_existing=True)
+        )
+        user = db_session.scalars(stmt).one_or_none()
+        # RETURNING already loaded the row; expiring it would force a reload
+        commit_keeping_loaded(db_session)
+        # No row comes back when a concurrent request already stored the same email
+        return user or self.get_user_by_auth0_id(db_session, creator.auth0_id)
@@ -19,10 +19,12 @@ from .wearables import (
     AuthorizationResponse,
     WearableConnection,
     ConnectionsResponse,
+    BootstrapResponse,
     TimeseriesDataPoint,
     TimeseriesResponse,
     SyncRequest,
     SyncResponse,
+    OpenWearablesUser,
     RegisterOpenWearablesResponse,
     Workout,
     WorkoutsResponse,
@@ -42,6 +44,7 @@ from .wearables import (
     BloodPressure,
     BodySummary,
     BodySummaryResponse,
+    AllSummariesResponse,
     AppleHealthImportResponse,
     SeriesTypeInfo,
     AvailableSeriesTypesResponse,
@@ -70,10 +73,12 @@ __all__ = [
     "AuthorizationResponse",
     "WearableConnection",
     "ConnectionsResponse",
+    "BootstrapResponse",
     "TimeseriesDataPoint",
     "TimeseriesResponse",
     "SyncRequest",
     "SyncResponse",
+    "OpenWearablesUser",
     "RegisterOpenWearablesResponse",
     "Workout",
     "WorkoutsResponse",
@@ -93,6 +98,7 @@ __all__ = [
     "BloodPressure",
     "BodySummary",
     "BodySummaryResponse",
+    "AllSummariesResponse",
     "AppleHealthImportResponse",
     "SeriesTypeInfo",
     "AvailableSeriesTypesResponse",
@@ -11,6 +11,7 @@ class UserInfo(BaseModel):
     user_id: UUID
     auth0_id: str
     email: str
+    open_wearables_user_id: UUID | None = None
     permissions: list[str]
     payload: dict[str, Any]
 
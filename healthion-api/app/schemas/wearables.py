@@ -2,13 +2,12 @@
 Schemas for Open Wearables integration.
 """
 
-from datetime import datetime
+from datetime import date, datetime
 from enum import Enum
 from typing import Literal
 from uuid import UUID
 
-from pydantic import BaseModel, Field
-
+from pydantic import AliasChoices, BaseModel, Field
 
 # ============================================
 # Enums
@@ -104,8 +103,8 @@ class ProvidersQueryParams(BaseModel):
 class TimeseriesQueryParams(BaseModel):
     """Query parameters for timeseries data."""
     
-    start_time: str = Field(..., description="Start time (ISO format)")
-    end_time: str = Field(..., description="End time (ISO format)")
+    start_time: datetime = Field(..., description="Start time (ISO format)")
+    end_time: datetime = Field(..., description="End time (ISO format)")
     types: list[str] = Field(
         default=["heart_rate"],
         description="Types: heart_rate, steps, heart_rate_variability_sdnn, etc. See SeriesType enum for all options."
@@ -119,8 +118,8 @@ class TimeseriesQueryParams(BaseModel):
 class DateRangeQueryParams(BaseModel):
     """Query parameters for date range based endpoints."""
     
-    start_date: str = Field(..., description="Start date (YYYY-MM-DD)")
-    end_date: str = Field(..., description="End date (YYYY-MM-DD)")
+    start_date: date = Field(..., description="Start date (YYYY-MM-DD)")
+    end_date: date = Field(..., description="End date (YYYY-MM-DD)")
     limit: int = Field(50, ge=1, le=100, description="Max results (max 100)")
 
 
@@ -174,6 +173,13 @@ class ConnectionsResponse(BaseModel):
     open_wearables_user_id: UUID | None = None
 
 
+class BootstrapResponse(BaseModel):
+    """Providers and user connections fetched together. A part that failed to load is null."""
+
+    providers: ProvidersResponse | None = None
+    connections: ConnectionsResponse | None = None
+
+
 class TimeseriesDataPoint(BaseModel):
     """Single data point in a time series."""
     
@@ -207,6 +213,13 @@ class SyncResponse(BaseModel):
     synced_count: int = 0
 
 
+class OpenWearablesUser(BaseModel):
+    """User record returned by Open Wearables."""
+
+    # Some Open Wearables versions name the key user_id
+    id: UUID = Field(validation_alias=AliasChoices("id", "user_id"))
+
+
 class RegisterOpenWearablesResponse(BaseModel):
     """Response for Open Wearables registration."""
     
@@ -437,6 +450,15 @@ class BodySummaryResponse(BaseModel):
     next_cursor: str | None = None
 
 
+class AllSummariesResponse(BaseModel):
+    """Activity, sleep, recovery and body summaries fetched together. A part that failed to load is null."""
+
+    activity: ActivitySummaryResponse | None = None
+    sleep: SleepSummaryResponse | None = None
+    recovery: RecoverySummaryResponse | None = None
+    body: BodySummaryResponse | None = None
+
+
 # ============================================
 # Apple Health Import Schemas
 # ============================================
@@ -20,6 +20,8 @@ class Auth0Service:
         self.issuer = settings.auth0_issuer_url
         self.algorithms = settings.auth0_algorithms
         self._jwks_cache: dict[str, Any] | None = None
+        # PEM keys decoded from the JWKS, keyed by kid
+        self._signing_keys: dict[str, str] = {}
         self.name = "auth"
 
     @handle_exceptions
@@ -51,6 +53,9 @@ class Auth0Service:
                     detail="Token missing 'kid' in header"
                 )
             
+            if (pem := self._signing_keys.get(kid)) is not None:
+                return pem
+
             for key in jwks.get("keys", []):
                 if key.get("kid") == kid:
                     # Validate RSA key structure - JWKS requires 'n' (modulus) and 'e' (exponent)
@@ -74,7 +79,8 @@ class Auth0Service:
                             format=serialization.PublicFormat.PKCS1
                         )
                         
-                        return pem_key.decode('utf-8')
+                        pem = self._signing_keys[kid] = pem_key.decode('utf-8')
+                        return pem
                     except (ValueError, OverflowError) as e:
                         # Skip invalid key and try next one
                         continue
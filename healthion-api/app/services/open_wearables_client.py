@@ -6,16 +6,80 @@ for wearable device data integration (Garmin, Polar, Suunto).
 """
 
 import asyncio
+import random
+import re
+from datetime import UTC, datetime, timedelta
 from logging import Logger, getLogger
+from types import MappingProxyType
 from typing import Any
 from uuid import UUID
+from weakref import WeakValueDictionary
 
 import httpx
+import orjson
+from cachetools import TTLCache
 
 from app.config import settings
-
-# Lock to prevent concurrent user creation (race condition prevention)
-_user_creation_locks: dict[str, asyncio.Lock] = {}
+from app.schemas import OpenWearablesUser
+
+# Locks to prevent concurrent creation of the same user, keyed by external_id.
+# Weak values: an entry disappears once no request holds or awaits its lock.
+_user_creation_locks: WeakValueDictionary[str, asyncio.Lock] = WeakValueDictionary()
+
+# Look-back windows for provider syncs and the legacy workouts list
+_GARMIN_SYNC_WINDOW = timedelta(hours=24)
+_SUUNTO_SYNC_WINDOW = timedelta(days=7)  # Suunto allows up to 28 days
+_WORKOUTS_WINDOW = timedelta(days=30)
+
+# Timeouts: ordinary calls fail fast so a degraded upstream cannot tie up the
+# pool; only sync and Apple Health import may run long (still failing fast on connect)
+_DEFAULT_TIMEOUT = httpx.Timeout(10.0, connect=2.0)
+_SYNC_TIMEOUT = httpx.Timeout(60.0, connect=2.0)
+_IMPORT_TIMEOUT = httpx.Timeout(300.0, connect=5.0)
+
+# Retry policy, one layer per failure kind: the transport retries connection
+# failures for all calls; GETs additionally retry gateway errors. Read timeouts
+# are never retried, so a slow upstream fails within one timeout.
+_CONNECT_RETRIES = 3
+_GET_ATTEMPTS = 4
+_RETRY_STATUSES = frozenset({502, 503, 504})
+_RETRY_BASE_DELAY = 0.1
+_RETRY_MAX_DELAY = 2.0
+
+# Query-string spelling of boolean flags
+_QUERY_BOOL = {True: "true", False: "false"}
+
+# Known sync rejections (HTTP 400 detail text) and the result reported for each
+_SYNC_ERROR_RE = re.compile(r"already exists|UniqueViolation|InvalidPullTokenException|28 days")
+_ALREADY_SYNCED: dict[str, Any] = {
+    "success": True,
+    "status": "success",
+    "message": "Data already synced - no new data to import",
+    "synced_count": 0,
+}
+_SYNC_ERROR_RESULTS: dict[str, dict[str, Any]] = {
+    "already exists": _ALREADY_SYNCED,
+    "UniqueViolation": _ALREADY_SYNCED,
+    # Garmin token issues - need to reconnect
+    "InvalidPullTokenException": {
+        "success": False,
+        "status": "error",
+        "message": "Garmin connection expired - please reconnect",
+        "synced_count": 0,
+    },
+    # Suunto date range error
+    "28 days": {
+        "success": False,
+        "status": "error",
+        "message": "Suunto sync date range too large - please try again",
+        "synced_count": 0,
+    },
+}
+
+
+def _parse(response: httpx.Response) -> Any:
+    """Decode a JSON response body with orjson."""
+    return orjson.loads(response.content)
 
 
 class OpenWearablesConfigurationError(Exception):
@@ -30,6 +94,18 @@ class OpenWearablesClient:
         self.base_url = settings.open_wearables_api_url.rstrip("/")
         self.api_key = settings.open_wearables_api_key
         self.log = log or getLogger(__name__)
+        # Sent with every request; the key and URL are fixed for the process lifetime
+        self._headers = MappingProxyType({
+            "X-Open-Wearables-API-Key": self.api_key,
+            "Content-Type": "application/json",
+        })
+        # Pooled keep-alive connections shared by all requests in this worker
+        self._http_client: httpx.AsyncClient | None = None
+        # The provider catalogue changes rarely; keyed by (enabled_only, cloud_only)
+        self._providers_cache: TTLCache[tuple[bool, bool], list[dict[str, Any]]] = TTLCache(maxsize=8, ttl=600)
+        self._providers_lock = asyncio.Lock()
+        # In-flight GETs keyed by (path, params), see _get()
+        self._inflight: dict[tuple, asyncio.Future[httpx.Response]] = {}
         
         if not self.api_key:
             self.log.warning(
@@ -37,6 +113,84 @@ class OpenWearablesClient:
                 "Open Wearables integration will not work."
             )
 
+    @property
+    def _client(self) -> httpx.AsyncClient:
+        """
+        Shared HTTP client, created on first use so it binds to the worker's event loop.
+
+        Raises OpenWearablesConfigurationError while the API key is missing.
+        """
+        if self._http_client is None:
+            self._ensure_configured()
+            self._http_client = httpx.AsyncClient(
+                base_url=self.base_url,
+                headers=self._headers,
+                timeout=_DEFAULT_TIMEOUT,
+                # Connection failures are retried for every method: nothing was sent yet
+                transport=httpx.AsyncHTTPTransport(
+                    retries=_CONNECT_RETRIES,
+                    limits=httpx.Limits(
+                        max_connections=200, max_keepalive_connections=100, keepalive_expiry=60,
+                    ),
+                    # Negotiated via ALPN on https; plain http URLs stay on HTTP/1.1
+                    http2=True,
+                ),
+            )
+        return self._http_client
+
+    async def warm_up(self) -> None:
+        """Open a pooled connection and prime the providers cache before the first request."""
+        if not self.is_configured:
+            return
+        try:
+            await self.get_providers()
+        except Exception:
+            # Runs as a background task: nothing awaits it, so log every failure here
+            self.log.exception("Open Wearables warm-up failed")
+
+    async def aclose(self) -> None:
+        """Close pooled connections to Open Wearables."""
+        if self._http_client is not None:
+            await self._http_client.aclose()
+            self._http_client = None
+
+    async def _get(self, path: str, params: dict[str, Any] | None = None) -> httpx.Response:
+        """
+        GET a read-only endpoint, sharing one upstream call between identical concurrent requests.
+
+        The first caller starts the request; callers arriving while it is in
+        flight await the same response instead of issuing their own.
+        """
+        client = self._client
+        key = (path, tuple(
+            (k, tuple(v) if isinstance(v, list) else v)
+            for k, v in sorted((params or {}).items())
+        ))
+        request = self._inflight.get(key)
+        if request is None:
+            request = asyncio.ensure_future(self._get_with_retry(client, path, params))
+            self._inflight[key] = request
+            request.add_done_callback(lambda _: self._inflight.pop(key, None))
+        # Shielded so one caller being cancelled does not cancel the others
+        return await asyncio.shield(request)
+
+    @staticmethod
+    async def _get_with_retry(
+        client: httpx.AsyncClient,
+        path: str,
+        params: dict[str, Any] | None,
+    ) -> httpx.Response:
+        """GET, retrying 502/503/504 with jittered exponential backoff.
+
+        Connection failures are already retried by the transport.
+        """
+        for attempt in range(1, _GET_ATTEMPTS + 1):
+            response = await client.get(path, params=params)
+            if response.status_code not in _RETRY_STATUSES or attempt == _GET_ATTEMPTS:
+                return response
+            # Full jitter: wait a random share of an exponentially growing cap
+            await asyncio.sleep(random.uniform(0, min(_RETRY_MAX_DELAY, _RETRY_BASE_DELAY * 2 ** attempt)))
+
     @property
     def is_configured(self) -> bool:
         """Check if the client is properly configured."""
@@ -50,14 +204,6 @@ class OpenWearablesClient:
                 "Set OPEN_WEARABLES_API_KEY environment variable."
             )
 
-    def _get_headers(self) -> dict[str, str]:
-        """Get headers for API requests."""
-        self._ensure_configured()
-        return {
-            "X-Open-Wearables-API-Key": self.api_key,
-            "Content-Type": "application/json",
-        }
-
     async def find_user_by_external_id(self, external_id: str) -> dict[str, Any] | None:
         """
         Find a user in Open Wearables by external_user_id.
@@ -71,51 +217,21 @@ class OpenWearablesClient:
         Returns:
             User data if found, None otherwise
         """
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{self.base_url}/api/v1/users",
-                headers=self._get_headers(),
-                params={"external_user_id": external_id, "limit": 1},
-                timeout=30.0,
-            )
-            response.raise_for_status()
-            data = response.json()
-            
-            items = data.get("items", [])
-            return items[0] if items else None
+        response = await self._client.get(
+            "/api/v1/users",
+            params={"external_user_id": external_id, "limit": 1},
+        )
+        response.raise_for_status()
+        data = _parse(response)
 
-    async def find_user_by_email(self, email: str) -> dict[str, Any] | None:
-        """
-        Find a user in Open Wearables by email.
-        
-        Note: Email is not unique in OW. Prefer find_user_by_external_id when possible.
-        
-        Args:
-            email: User's email address
-            
-        Returns:
-            User data if found, None otherwise
-        """
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{self.base_url}/api/v1/users",
-                headers=self._get_headers(),
-                params={"limit": 100},
-                timeout=30.0,
-            )
-            response.raise_for_status()
-            data = response.json()
-            
-            for user in data.get("items", []):
-                if user.get("email") == email:
-                    return user
-            return None
+        items = data.get("items", [])
+        return items[0] if items else None
 
-    async def create_user(self, external_id: str, email: str) -> dict[str, Any]:
+    async def create_user(self, external_id: str, email: str) -> OpenWearablesUser:
         """
         Create a new user in Open Wearables, or return existing if already exists.
         
-        Uses per-email locking to prevent race conditions where multiple
+        Uses per-user locking to prevent race conditions where multiple
         concurrent requests could create duplicate users.
         
         Args:
@@ -123,32 +239,36 @@ class OpenWearablesClient:
             email: User's email address
             
         Returns:
-            Created or existing user data including the Open Wearables user ID
+            Created or existing Open Wearables user
         """
-        # Get or create a lock for this email (prevents concurrent creation)
-        if email not in _user_creation_locks:
-            _user_creation_locks[email] = asyncio.Lock()
+        # Check if user already exists by external_id (more reliable than email);
+        # existing users, the common case, never wait on the lock
+        existing = await self.find_user_by_external_id(external_id)
+        if existing:
+            return OpenWearablesUser.model_validate(existing)
+
+        # Get or create a lock for this user (prevents concurrent creation)
+        lock = _user_creation_locks.get(external_id)
+        if lock is None:
+            lock = _user_creation_locks[external_id] = asyncio.Lock()
         
-        async with _user_creation_locks[email]:
-            # Check if user already exists by external_id (more reliable than email)
+        async with lock:
+            # Re-check: another request may have created the user while we waited
             existing = await self.find_user_by_external_id(external_id)
             if existing:
                 self.log.info(f"User with external_id {external_id} already exists in OW: {existing.get('id')}")
-                return existing
+                return OpenWearablesUser.model_validate(existing)
             
             # Create new user (inside lock to prevent races)
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    f"{self.base_url}/api/v1/users",
-                    headers=self._get_headers(),
-                    json={
-                        "external_user_id": external_id,  # Links back to Healthion user
-                        "email": email,
-                    },
-                    timeout=30.0,
-                )
-                response.raise_for_status()
-                return response.json()
+            response = await self._client.post(
+                "/api/v1/users",
+                content=orjson.dumps({
+                    "external_user_id": external_id,  # Links back to Healthion user
+                    "email": email,
+                }),
+            )
+            response.raise_for_status()
+            return OpenWearablesUser.model_validate_json(response.content)
 
     async def get_user(self, user_id: UUID) -> dict[str, Any]:
         """
@@ -160,14 +280,9 @@ class OpenWearablesClient:
         Returns:
             User data
         """
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{self.base_url}/api/v1/users/{user_id}",
-                headers=self._get_headers(),
-                timeout=30.0,
-            )
-            response.raise_for_status()
-            return response.json()
+        response = await self._get(f"/api/v1/users/{user_id}")
+        response.raise_for_status()
+        return _parse(response)
 
     async def get_providers(
         self, 
@@ -184,18 +299,26 @@ class OpenWearablesClient:
         Returns:
             List of provider details including name, icon_url, etc.
         """
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{self.base_url}/api/v1/oauth/providers",
-                headers=self._get_headers(),
+        key = (enabled_only, cloud_only)
+        if (cached := self._providers_cache.get(key)) is not None:
+            return cached
+
+        # Only one request refreshes an expired entry; the rest wait for it
+        async with self._providers_lock:
+            if (cached := self._providers_cache.get(key)) is not None:
+                return cached
+
+            response = await self._client.get(
+                "/api/v1/oauth/providers",
                 params={
-                    "enabled_only": str(enabled_only).lower(),
-                    "cloud_only": str(cloud_only).lower(),
+                    "enabled_only": _QUERY_BOOL[enabled_only],
+                    "cloud_only": _QUERY_BOOL[cloud_only],
                 },
-                timeout=30.0,
             )
             response.raise_for_status()
-            return response.json()
+            providers = _parse(response)
+            self._providers_cache[key] = providers
+            return providers
 
     async def get_authorization_url(
         self, 
@@ -218,15 +341,12 @@ class OpenWearablesClient:
         if redirect_uri:
             params["redirect_uri"] = redirect_uri
             
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{self.base_url}/api/v1/oauth/{provider}/authorize",
-                headers=self._get_headers(),
-                params=params,
-                timeout=30.0,
-            )
-            response.raise_for_status()
-            return response.json()
+        response = await self._client.get(
+            f"/api/v1/oauth/{provider}/authorize",
+            params=params,
+        )
+        response.raise_for_status()
+        return _parse(response)
 
     async def get_user_connections(self, user_id: UUID) -> list[dict[str, Any]]:
         """
@@ -238,14 +358,9 @@ class OpenWearablesClient:
         Returns:
             List of user's provider connections
         """
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{self.base_url}/api/v1/users/{user_id}/connections",
-                headers=self._get_headers(),
-                timeout=30.0,
-            )
-            response.raise_for_status()
-            return response.json()
+        response = await self._get(f"/api/v1/users/{user_id}/connections")
+        response.raise_for_status()
+        return _parse(response)
 
     async def get_timeseries(
         self,
@@ -275,7 +390,7 @@ class OpenWearablesClient:
         params: dict[str, Any] = {
             "start_time": start_time,
             "end_time": end_time,
-            "limit": min(limit, 100),
+            "limit": limit,
             "resolution": resolution,
         }
         
@@ -286,15 +401,9 @@ class OpenWearablesClient:
         if cursor:
             params["cursor"] = cursor
 
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{self.base_url}/api/v1/users/{user_id}/timeseries",
-                headers=self._get_headers(),
-                params=params,
-                timeout=30.0,
-            )
-            response.raise_for_status()
-            return response.json()
+        response = await self._get(f"/api/v1/users/{user_id}/timeseries", params)
+        response.raise_for_status()
+        return _parse(response)
 
     async def sync_user_data(
         self,
@@ -313,67 +422,39 @@ class OpenWearablesClient:
         Returns:
             Sync status
         """
-        from datetime import datetime, timedelta
-        import time
-        
         provider_lower = provider.lower()
         params: dict[str, Any] = {"data_type": data_type}
         
-        now = datetime.utcnow()
-        
         # Provider-specific time parameters
         if provider_lower == "garmin":
-            # Garmin requires time range parameters (max 24h)
-            start = now - timedelta(hours=24)
-            params["summary_start_time"] = start.strftime("%Y-%m-%dT%H:%M:%S")
-            params["summary_end_time"] = now.strftime("%Y-%m-%dT%H:%M:%S")
+            # Garmin requires time range parameters (max 24h), as UTC without an offset
+            now = datetime.now(UTC).replace(tzinfo=None)
+            start = now - _GARMIN_SYNC_WINDOW
+            params["summary_start_time"] = start.isoformat(timespec="seconds")
+            params["summary_end_time"] = now.isoformat(timespec="seconds")
         elif provider_lower == "suunto":
             # Suunto requires 'since' as Unix timestamp (max 28 days)
-            # Use 7 days for more manageable sync
-            start = now - timedelta(days=7)
+            start = datetime.now(UTC) - _SUUNTO_SYNC_WINDOW
             params["since"] = int(start.timestamp())
         
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.base_url}/api/v1/providers/{provider_lower}/users/{user_id}/sync",
-                headers=self._get_headers(),
-                params=params,
-                timeout=60.0,
-            )
-            
-            # Handle duplicate data error gracefully
-            if response.status_code == 400:
-                try:
-                    error_data = response.json()
-                    error_detail = error_data.get("detail", "")
-                    if "already exists" in error_detail or "UniqueViolation" in error_detail:
-                        return {
-                            "success": True,
-                            "status": "success", 
-                            "message": "Data already synced - no new data to import",
-                            "synced_count": 0
-                        }
-                    # Garmin token issues - need to reconnect
-                    if "InvalidPullTokenException" in error_detail:
-                        return {
-                            "success": False,
-                            "status": "error",
-                            "message": "Garmin connection expired - please reconnect",
-                            "synced_count": 0
-                        }
-                    # Suunto date range error
-                    if "28 days" in error_detail:
-                        return {
-                            "success": False,
-                            "status": "error",
-                            "message": "Suunto sync date range too large - please try again",
-                            "synced_count": 0
-                        }
-                except Exception:
-                    pass
-            
-            response.raise_for_status()
-            return response.json()
+        response = await self._client.post(
+            f"/api/v1/providers/{provider_lower}/users/{user_id}/sync",
+            params=params,
+            timeout=_SYNC_TIMEOUT,
+        )
+
+        # Handle duplicate data error gracefully
+        if response.status_code == 400 and response.content:
+            try:
+                error_detail = _parse(response).get("detail", "")
+            except (orjson.JSONDecodeError, AttributeError):
+                # Not a JSON object: match against the raw body instead
+                error_detail = response.text
+            if isinstance(error_detail, str) and (match := _SYNC_ERROR_RE.search(error_detail)):
+                return dict(_SYNC_ERROR_RESULTS[match.group(0)])
+
+        response.raise_for_status()
+        return _parse(response)
 
     async def get_workouts(
         self,
@@ -390,29 +471,21 @@ class OpenWearablesClient:
         Returns:
             List of workouts
         """
-        from datetime import datetime, timedelta
-        
         # Use events endpoint with last 30 days
-        now = datetime.utcnow()
-        start = now - timedelta(days=30)
+        today = datetime.now(UTC).date()
+        start = today - _WORKOUTS_WINDOW
         
         params: dict[str, Any] = {
-            "start_date": start.strftime("%Y-%m-%d"),
-            "end_date": now.strftime("%Y-%m-%d"),
+            "start_date": start.isoformat(),
+            "end_date": today.isoformat(),
             "limit": limit,
         }
 
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{self.base_url}/api/v1/users/{user_id}/events/workouts",
-                headers=self._get_headers(),
-                params=params,
-                timeout=30.0,
-            )
-            response.raise_for_status()
-            result = response.json()
-            # Return just the data array for backward compatibility
-            return result.get("data", [])
+        response = await self._get(f"/api/v1/users/{user_id}/events/workouts", params)
+        response.raise_for_status()
+        result = _parse(response)
+        # Return just the data array for backward compatibility
+        return result.get("data", [])
 
     async def get_event_workouts(
         self,
@@ -440,22 +513,16 @@ class OpenWearablesClient:
         params: dict[str, Any] = {
             "start_date": start_date,
             "end_date": end_date,
-            "limit": min(limit, 100),
+            "limit": limit,
         }
         if workout_type:
             params["type"] = workout_type
         if cursor:
             params["cursor"] = cursor
 
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{self.base_url}/api/v1/users/{user_id}/events/workouts",
-                headers=self._get_headers(),
-                params=params,
-                timeout=30.0,
-            )
-            response.raise_for_status()
-            return response.json()
+        response = await self._get(f"/api/v1/users/{user_id}/events/workouts", params)
+        response.raise_for_status()
+        return _parse(response)
 
     async def get_sleep_sessions(
         self,
@@ -481,20 +548,14 @@ class OpenWearablesClient:
         params: dict[str, Any] = {
             "start_date": start_date,
             "end_date": end_date,
-            "limit": min(limit, 100),
+            "limit": limit,
         }
         if cursor:
             params["cursor"] = cursor
 
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{self.base_url}/api/v1/users/{user_id}/events/sleep",
-                headers=self._get_headers(),
-                params=params,
-                timeout=30.0,
-            )
-            response.raise_for_status()
-            return response.json()
+        response = await self._get(f"/api/v1/users/{user_id}/events/sleep", params)
+        response.raise_for_status()
+        return _parse(response)
 
     async def get_activity_summary(
         self,
@@ -520,23 +581,17 @@ class OpenWearablesClient:
         params: dict[str, Any] = {
             "start_date": start_date,
             "end_date": end_date,
-            "limit": min(limit, 100),
+            "limit": limit,
         }
         if cursor:
             params["cursor"] = cursor
 
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{self.base_url}/api/v1/users/{user_id}/summaries/activity",
-                headers=self._get_headers(),
-                params=params,
-                timeout=30.0,
-            )
-            # Handle "Not implemented" gracefully
-            if response.status_code == 501:
-                return {"data": [], "pagination": {"has_more": False}}
-            response.raise_for_status()
-            return response.json()
+        response = await self._get(f"/api/v1/users/{user_id}/summaries/activity", params)
+        # Handle "Not implemented" gracefully
+        if response.status_code == 501:
+            return {"data": [], "pagination": {"has_more": False}}
+        response.raise_for_status()
+        return _parse(response)
 
     async def get_sleep_summary(
         self,
@@ -562,23 +617,17 @@ class OpenWearablesClient:
         params: dict[str, Any] = {
             "start_date": start_date,
             "end_date": end_date,
-            "limit": min(limit, 100),
+            "limit": limit,
         }
         if cursor:
             params["cursor"] = cursor
 
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{self.base_url}/api/v1/users/{user_id}/summaries/sleep",
-                headers=self._get_headers(),
-                params=params,
-                timeout=30.0,
-            )
-            # Handle "Not implemented" gracefully
-            if response.status_code == 501:
-                return {"data": [], "pagination": {"has_more": False}}
-            response.raise_for_status()
-            return response.json()
+        response = await self._get(f"/api/v1/users/{user_id}/summaries/sleep", params)
+        # Handle "Not implemented" gracefully
+        if response.status_code == 501:
+            return {"data": [], "pagination": {"has_more": False}}
+        response.raise_for_status()
+        return _parse(response)
 
     async def get_recovery_summary(
         self,
@@ -604,23 +653,17 @@ class OpenWearablesClient:
         params: dict[str, Any] = {
             "start_date": start_date,
             "end_date": end_date,
-            "limit": min(limit, 100),
+            "limit": limit,
         }
         if cursor:
             params["cursor"] = cursor
 
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{self.base_url}/api/v1/users/{user_id}/summaries/recovery",
-                headers=self._get_headers(),
-                params=params,
-                timeout=30.0,
-            )
-            # Handle "Not implemented" gracefully
-            if response.status_code == 501:
-                return {"data": [], "pagination": {"has_more": False}}
-            response.raise_for_status()
-            return response.json()
+        response = await self._get(f"/api/v1/users/{user_id}/summaries/recovery", params)
+        # Handle "Not implemented" gracefully
+        if response.status_code == 501:
+            return {"data": [], "pagination": {"has_more": False}}
+        response.raise_for_status()
+        return _parse(response)
 
     async def get_body_summary(
         self,
@@ -646,23 +689,17 @@ class OpenWearablesClient:
         params: dict[str, Any] = {
             "start_date": start_date,
             "end_date": end_date,
-            "limit": min(limit, 100),
+            "limit": limit,
         }
         if cursor:
             params["cursor"] = cursor
 
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{self.base_url}/api/v1/users/{user_id}/summaries/body",
-                headers=self._get_headers(),
-                params=params,
-                timeout=30.0,
-            )
-            # Handle "Not implemented" gracefully
-            if response.status_code == 501:
-                return {"data": [], "pagination": {"has_more": False}}
-            response.raise_for_status()
-            return response.json()
+        response = await self._get(f"/api/v1/users/{user_id}/summaries/body", params)
+        # Handle "Not implemented" gracefully
+        if response.status_code == 501:
+            return {"data": [], "pagination": {"has_more": False}}
+        response.raise_for_status()
+        return _parse(response)
 
     async def get_workout_detail(
         self,
@@ -681,14 +718,9 @@ class OpenWearablesClient:
         Returns:
             Detailed workout data including heart rate, pace, power, etc.
         """
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{self.base_url}/api/v1/providers/{provider.lower()}/users/{user_id}/workouts/{workout_id}",
-                headers=self._get_headers(),
-                timeout=30.0,
-            )
-            response.raise_for_status()
-            return response.json()
+        response = await self._get(f"/api/v1/providers/{provider.lower()}/users/{user_id}/workouts/{workout_id}")
+        response.raise_for_status()
+        return _parse(response)
 
     async def import_apple_health_xml(
         self,
@@ -708,15 +740,13 @@ class OpenWearablesClient:
         Returns:
             Import status with record counts
         """
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.base_url}/api/v1/users/{user_id}/import/apple/xml",
-                headers=self._get_headers(),
-                json={"file_key": file_key},
-                timeout=300.0,  # Long timeout for large imports
-            )
-            response.raise_for_status()
-            return response.json()
+        response = await self._client.post(
+            f"/api/v1/users/{user_id}/import/apple/xml",
+            content=orjson.dumps({"file_key": file_key}),
+            timeout=_IMPORT_TIMEOUT,
+        )
+        response.raise_for_status()
+        return _parse(response)
 
     async def get_provider_workouts(
         self,
@@ -735,15 +765,9 @@ class OpenWearablesClient:
         Returns:
             List of workouts from the provider
         """
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{self.base_url}/api/v1/providers/{provider.lower()}/users/{user_id}/workouts",
-                headers=self._get_headers(),
-                params={"limit": limit},
-                timeout=30.0,
-            )
-            response.raise_for_status()
-            return response.json()
+        response = await self._get(f"/api/v1/providers/{provider.lower()}/users/{user_id}/workouts", {"limit": limit})
+        response.raise_for_status()
+        return _parse(response)
 
 
 # Singleton instance
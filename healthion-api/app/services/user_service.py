@@ -1,13 +1,40 @@
+import asyncio
 from logging import Logger, getLogger
 from uuid import UUID
+from weakref import WeakValueDictionary
 
-from app.database import DbSession
+from sqlalchemy import Row, bindparam, func, select, text, update
+from sqlalchemy.orm.attributes import set_committed_value
+from starlette.concurrency import run_in_threadpool
+
+from app.database import DbSession, commit_keeping_loaded
 from app.models import User
 from app.repositories import UserRepository
 from app.schemas import UserCreate, UserUpdate
 from app.services import AppService
 from app.services.open_wearables_client import open_wearables_client
-from app.utils.exceptions import handle_exceptions
+
+# Registration statements are built once; only their parameters change per call.
+# Atomic update: only update if still NULL, so a lost race never overwrites the winner
+_SAVE_OPEN_WEARABLES_ID = (
+    update(User)
+    .where(User.id == bindparam("user_id"))
+    .where(User.open_wearables_user_id.is_(None))  # Only if still NULL
+    .values(open_wearables_user_id=bindparam("ow_user_id"), version=User.version + 1)
+    .returning(User.open_wearables_user_id, User.version)
+)
+_SELECT_OPEN_WEARABLES_ID = select(User.open_wearables_user_id, User.version).where(
+    User.id == bindparam("user_id"),
+)
+# Transaction-scoped advisory lock so only one worker process registers a given user;
+# it is released by the commit that stores the OW id (or by rollback on failure).
+# The transaction, and its pooled connection, stay open across the create_user
+# HTTP call, so that call is bounded and Postgres ends the session if it idles longer.
+_TRY_LOCK_REGISTRATION = select(
+    func.pg_try_advisory_xact_lock(func.hashtext(bindparam("lock_key"))),
+)
+_BOUND_IDLE_IN_TRANSACTION = text("SET LOCAL idle_in_transaction_session_timeout = '30s'")
+_CREATE_USER_TIMEOUT = 15.0
 
 
 class UserService(AppService[UserRepository, User, UserCreate, UserUpdate]):
@@ -16,90 +43,119 @@ class UserService(AppService[UserRepository, User, UserCreate, UserUpdate]):
             crud_model=UserRepository,
             model=User,
             log=log,
-            **kwargs
+            **kwargs,
         )
-        self.user_repository = UserRepository(User)
+        # Per-user registration locks; weak values drop entries nobody is waiting on
+        self._registration_locks: WeakValueDictionary[UUID, asyncio.Lock] = WeakValueDictionary()
 
     def get_or_create_user(self, db_session: DbSession, auth0_id: str, email: str) -> User:
         if not auth0_id or not email:
             raise ValueError("auth0_id and email are required")
-        
+
         user = self._get_user_by_auth0_id(db_session, auth0_id)
-        
-        if user:
-            if str(user.email) != email:
-                user_update = UserUpdate(email=email)
-                user = self.update(db_session, user.id, user_update)
+
+        if user and user.email == email:
             return user
-        
-        user_create = UserCreate(
-            auth0_id=auth0_id,
-            email=email
+
+        # New user or changed email: a single upsert, safe against concurrent first logins
+        return self.crud.upsert_user(
+            db_session, UserCreate(auth0_id=auth0_id, email=email),
         )
-        
-        return self.create(db_session, user_create)
 
     async def register_with_open_wearables(
-        self, 
-        db_session: DbSession, 
-        user: User
+        self,
+        db_session: DbSession,
+        user: User,
     ) -> User:
         """
         Register user with Open Wearables platform.
-        
-        Uses optimistic locking - the OW client returns existing user if 
+
+        Uses optimistic locking - the OW client returns existing user if
         duplicate detected, and we use atomic UPDATE WHERE to prevent races.
-        
+        Concurrent registrations of the same user are skipped: within a process
+        via a per-user lock, across workers via a PostgreSQL advisory lock.
+
         Args:
             db_session: Database session
             user: User to register
-            
+
         Returns:
             Updated user with open_wearables_user_id
         """
         # Quick check (may be stale, but that's OK - we'll check again)
         if user.open_wearables_user_id:
-            self.logger.info(f"User {user.id} already registered with Open Wearables")
+            self.logger.info("User %s already registered with Open Wearables", user.id)
             return user
-        
-        try:
-            # Call OW to create/get user (OW handles duplicates by email)
-            result = await open_wearables_client.create_user(
-                external_id=user.auth0_id,
-                email=str(user.email)
-            )
-            
-            ow_user_id = UUID(result.get("id") or result.get("user_id"))
-            
-            # Atomic update: only update if still NULL (optimistic locking)
-            # This prevents race conditions without holding locks during HTTP calls
-            from sqlalchemy import update
-            stmt = (
-                update(User)
-                .where(User.id == user.id)
-                .where(User.open_wearables_user_id.is_(None))  # Only if still NULL
-                .values(open_wearables_user_id=ow_user_id)
-            )
-            result = db_session.execute(stmt)
-            db_session.commit()
-            
-            if result.rowcount > 0:
-                self.logger.info(
-                    f"User {user.id} registered with Open Wearables as {ow_user_id}"
+
+        lock = self._registration_locks.get(user.id)
+        if lock is None:
+            lock = self._registration_locks[user.id] = asyncio.Lock()
+
+        waited = lock.locked()
+        async with lock:
+            # A concurrent request for this user may have registered it while we waited
+            if waited:
+                row = await run_in_threadpool(self._load_open_wearables_id, db_session, user.id)
+                if row.open_wearables_user_id:
+                    set_committed_value(user, "open_wearables_user_id", row.open_wearables_user_id)
+                    set_committed_value(user, "version", row.version)
+                    return user
+
+            if not await run_in_threadpool(self._try_lock_registration, db_session, user.id):
+                self.logger.info("User %s is being registered by another worker", user.id)
+                return user
+
+            try:
+                # Call OW to create/get user (OW handles duplicates by email)
+                async with asyncio.timeout(_CREATE_USER_TIMEOUT):
+                    ow_user = await open_wearables_client.create_user(
+                        external_id=user.auth0_id,
+                        email=user.email,
+                    )
+                ow_user_id = ow_user.id
+
+                row = await run_in_threadpool(
+                    self._save_open_wearables_id, db_session, user.id, ow_user_id,
                 )
-            else:
-                self.logger.info(f"User {user.id} already registered by another request")
-            
-            # Refresh user to get current state
-            db_session.refresh(user)
-            return user
-            
-        except Exception as e:
-            self.logger.error(f"Failed to register user {user.id} with Open Wearables: {e}")
-            raise
+
+                # Apply the stored value in place instead of refreshing the whole row
+                set_committed_value(user, "open_wearables_user_id", row.open_wearables_user_id)
+                set_committed_value(user, "version", row.version)
+                return user
+
+            except Exception:
+                self.logger.exception("Failed to register user %s with Open Wearables", user.id)
+                # Release the advisory lock now rather than when the request ends
+                await run_in_threadpool(db_session.rollback)
+                raise
+
+    def _try_lock_registration(self, db_session: DbSession, user_id: UUID) -> bool:
+        db_session.execute(_BOUND_IDLE_IN_TRANSACTION)
+        return db_session.execute(
+            _TRY_LOCK_REGISTRATION, {"lock_key": f"ow_registration:{user_id}"},
+        ).scalar_one()
+
+    def _load_open_wearables_id(self, db_session: DbSession, user_id: UUID) -> Row:
+        return db_session.execute(_SELECT_OPEN_WEARABLES_ID, {"user_id": user_id}).one()
+
+    def _save_open_wearables_id(self, db_session: DbSession, user_id: UUID, ow_user_id: UUID) -> Row:
+        """Store the OW id unless already set; return the stored id and row version."""
+        row = db_session.execute(
+            _SAVE_OPEN_WEARABLES_ID, {"user_id": user_id, "ow_user_id": ow_user_id},
+        ).first()
+
+        if row is not None:
+            self.logger.info("User %s registered with Open Wearables as %s", user_id, ow_user_id)
+        else:
+            self.logger.info("User %s already registered by another request", user_id)
+            # Only a lost race needs to read back the winner's value
+            row = db_session.execute(_SELECT_OPEN_WEARABLES_ID, {"user_id": user_id}).first()
+        # The caller applies the row to the user in place, so it need not be reloaded
+        commit_keeping_loaded(db_session)
+        return row
 
     def _get_user_by_auth0_id(self, db_session: DbSession, auth0_id: str) -> User | None:
-        return self.user_repository.get_user_by_auth0_id(db_session, auth0_id)
+        return self.crud.get_user_by_auth0_id(db_session, auth0_id)
 
 
 user_service = UserService(log=getLogger(__name__))
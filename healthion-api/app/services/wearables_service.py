@@ -5,21 +5,32 @@ Handles business logic for wearable data operations, delegating
 API calls to the Open Wearables client.
 """
 
+import asyncio
+from collections.abc import Awaitable, Callable
+from functools import wraps
 from logging import Logger, getLogger
+from typing import Any, Concatenate
 from uuid import UUID
 
+from cachetools import TTLCache
 from fastapi import HTTPException, status
+from pydantic import BaseModel
+from sqlalchemy import select
+from starlette.concurrency import run_in_threadpool
 
 from app.database import DbSession
 from app.models import User
 from app.schemas.wearables import (
     ActivitySummary,
     ActivitySummaryResponse,
+    AllSummariesResponse,
     AppleHealthImportResponse,
     AuthorizationResponse,
+    AvailableSeriesTypesResponse,
     BloodPressure,
     BodySummary,
     BodySummaryResponse,
+    BootstrapResponse,
     ConnectionsResponse,
     DataSource,
     DateRangeQueryParams,
@@ -33,7 +44,6 @@ from app.schemas.wearables import (
     RegisterOpenWearablesResponse,
     SeriesType,
     SeriesTypeInfo,
-    AvailableSeriesTypesResponse,
     SleepSession,
     SleepSessionsResponse,
     SleepStages,
@@ -41,7 +51,6 @@ from app.schemas.wearables import (
     SleepSummaryResponse,
     SyncRequest,
     SyncResponse,
-    TimeseriesDataPoint,
     TimeseriesQueryParams,
     TimeseriesResponse,
     WearableConnection,
@@ -52,6 +61,132 @@ from app.schemas.wearables import (
 )
 from app.services.open_wearables_client import open_wearables_client
 from app.services.user_service import user_service
+from app.utils.exceptions import handle_upstream_errors
+
+# Display name, unit and category for each series type
+_SERIES_TYPE_INFO: dict[SeriesType, tuple[str, str, str]] = {
+    # Heart & Cardiovascular
+    SeriesType.HEART_RATE: ("Heart Rate", "bpm", "cardiovascular"),
+    SeriesType.RESTING_HEART_RATE: ("Resting Heart Rate", "bpm", "cardiovascular"),
+    SeriesType.HEART_RATE_VARIABILITY_SDNN: ("Heart Rate Variability (SDNN)", "ms", "cardiovascular"),
+    SeriesType.HEART_RATE_RECOVERY_ONE_MINUTE: ("Heart Rate Recovery (1 min)", "bpm", "cardiovascular"),
+    SeriesType.WALKING_HEART_RATE_AVERAGE: ("Walking Heart Rate Average", "bpm", "cardiovascular"),
+    # Blood & Oxygen
+    SeriesType.OXYGEN_SATURATION: ("Blood Oxygen Saturation", "%", "blood"),
+    SeriesType.BLOOD_GLUCOSE: ("Blood Glucose", "mg/dL", "blood"),
+    SeriesType.BLOOD_PRESSURE_SYSTOLIC: ("Blood Pressure (Systolic)", "mmHg", "blood"),
+    SeriesType.BLOOD_PRESSURE_DIASTOLIC: ("Blood Pressure (Diastolic)", "mmHg", "blood"),
+    # Respiratory
+    SeriesType.RESPIRATORY_RATE: ("Respiratory Rate", "breaths/min", "respiratory"),
+    SeriesType.SLEEPING_BREATHING_DISTURBANCES: ("Sleep Breathing Disturbances", "events/hr", "respiratory"),
+    # Body Metrics
+    SeriesType.HEIGHT: ("Height", "cm", "body"),
+    SeriesType.WEIGHT: ("Weight", "kg", "body"),
+    SeriesType.BODY_FAT_PERCENTAGE: ("Body Fat Percentage", "%", "body"),
+    SeriesType.BODY_MASS_INDEX: ("Body Mass Index (BMI)", "kg/m²", "body"),
+    SeriesType.LEAN_BODY_MASS: ("Lean Body Mass", "kg", "body"),
+    SeriesType.BODY_TEMPERATURE: ("Body Temperature", "°C", "body"),
+    # Fitness
+    SeriesType.VO2_MAX: ("VO2 Max", "mL/kg/min", "fitness"),
+    SeriesType.SIX_MINUTE_WALK_TEST_DISTANCE: ("6-Minute Walk Test Distance", "m", "fitness"),
+    # Activity
+    SeriesType.STEPS: ("Steps", "count", "activity"),
+    SeriesType.ENERGY: ("Active Energy", "kcal", "activity"),
+    SeriesType.BASAL_ENERGY: ("Basal Energy", "kcal", "activity"),
+    SeriesType.STAND_TIME: ("Stand Time", "min", "activity"),
+    SeriesType.EXERCISE_TIME: ("Exercise Time", "min", "activity"),
+    SeriesType.PHYSICAL_EFFORT: ("Physical Effort", "MET", "activity"),
+    SeriesType.FLIGHTS_CLIMBED: ("Flights Climbed", "count", "activity"),
+    # Distance
+    SeriesType.DISTANCE_WALKING_RUNNING: ("Walking + Running Distance", "km", "distance"),
+    SeriesType.DISTANCE_CYCLING: ("Cycling Distance", "km", "distance"),
+    SeriesType.DISTANCE_SWIMMING: ("Swimming Distance", "m", "distance"),
+    SeriesType.DISTANCE_DOWNHILL_SNOW_SPORTS: ("Downhill Snow Sports Distance", "km", "distance"),
+    # Walking Metrics
+    SeriesType.WALKING_STEP_LENGTH: ("Walking Step Length", "cm", "walking"),
+    SeriesType.WALKING_SPEED: ("Walking Speed", "km/h", "walking"),
+    SeriesType.WALKING_DOUBLE_SUPPORT_PERCENTAGE: ("Double Support Time", "%", "walking"),
+    SeriesType.WALKING_ASYMMETRY_PERCENTAGE: ("Walking Asymmetry", "%", "walking"),
+    SeriesType.WALKING_STEADINESS: ("Walking Steadiness", "%", "walking"),
+    SeriesType.STAIR_DESCENT_SPEED: ("Stair Descent Speed", "m/s", "walking"),
+    SeriesType.STAIR_ASCENT_SPEED: ("Stair Ascent Speed", "m/s", "walking"),
+    # Running Metrics
+    SeriesType.RUNNING_POWER: ("Running Power", "W", "running"),
+    SeriesType.RUNNING_SPEED: ("Running Speed", "km/h", "running"),
+    SeriesType.RUNNING_VERTICAL_OSCILLATION: ("Vertical Oscillation", "cm", "running"),
+    SeriesType.RUNNING_GROUND_CONTACT_TIME: ("Ground Contact Time", "ms", "running"),
+    SeriesType.RUNNING_STRIDE_LENGTH: ("Running Stride Length", "m", "running"),
+    # Swimming & Cycling
+    SeriesType.SWIMMING_STROKE_COUNT: ("Swimming Stroke Count", "count", "swimming"),
+    SeriesType.CADENCE: ("Cadence", "rpm", "cycling"),
+    SeriesType.POWER: ("Power", "W", "cycling"),
+    # Environment
+    SeriesType.ENVIRONMENTAL_AUDIO_EXPOSURE: ("Environmental Audio Exposure", "dB", "environment"),
+    SeriesType.HEADPHONE_AUDIO_EXPOSURE: ("Headphone Audio Exposure", "dB", "environment"),
+    SeriesType.ENVIRONMENTAL_SOUND_REDUCTION: ("Sound Reduction", "dB", "environment"),
+    SeriesType.TIME_IN_DAYLIGHT: ("Time in Daylight", "min", "environment"),
+    SeriesType.WATER_TEMPERATURE: ("Water Temperature", "°C", "environment"),
+}
+
+
+def _build_available_series_types() -> AvailableSeriesTypesResponse:
+    types = []
+    for series_type in SeriesType:
+        info = _SERIES_TYPE_INFO.get(series_type, (series_type.value.replace("_", " ").title(), None, None))
+        types.append(SeriesTypeInfo(
+            name=series_type.value,
+            description=info[0],
+            unit=info[1],
+            category=info[2],
+        ))
+    return AvailableSeriesTypesResponse(types=types, total=len(types))
+
+
+# The catalogue is static; built once and shared (callers must not mutate it)
+_AVAILABLE_SERIES_TYPES = _build_available_series_types()
+
+
+def _timeseries_point(item: dict[str, Any]) -> dict[str, Any]:
+    """Map an upstream timeseries item to the TimeseriesDataPoint shape."""
+    return {
+        "timestamp": item.get("timestamp") or item.get("recorded_at"),
+        # Lets clients split a multi-type response by series
+        "type": item.get("type"),
+        "value": item.get("value", item.get("bpm", 0)),
+        "unit": item.get("unit", "bpm"),
+    }
+
+
+# Upstream health data only changes when a sync or import lands, which clears
+# the user's entries; the TTL bounds staleness for data synced by other paths
+_RESPONSE_CACHE_TTL = 60
+_RESPONSE_CACHE_SIZE = 512
+
+
+def _cached_per_user[T: BaseModel](
+    func: Callable[Concatenate["WearablesService", UUID | None, ...], Awaitable[T]],
+) -> Callable[Concatenate["WearablesService", UUID | None, ...], Awaitable[T]]:
+    """Cache a read method's response per Open Wearables user and arguments."""
+    @wraps(func)
+    async def wrapper(
+        self: "WearablesService", open_wearables_user_id: UUID | None, *args: Any,
+    ) -> T:
+        if not open_wearables_user_id:
+            return await func(self, open_wearables_user_id, *args)
+
+        key = (
+            open_wearables_user_id,
+            func.__name__,
+            *(a.model_dump_json() if isinstance(a, BaseModel) else a for a in args),
+        )
+        if (cached := self._response_cache.get(key)) is not None:
+            return cached
+
+        result = await func(self, open_wearables_user_id, *args)
+        self._response_cache[key] = result
+        return result
+
+    return wrapper
 
 
 class WearablesService:
@@ -60,6 +195,15 @@ class WearablesService:
     def __init__(self, log: Logger | None = None):
         self.log = log or getLogger(__name__)
         self.client = open_wearables_client
+        # Responses are shared between requests and must not be mutated
+        self._response_cache: TTLCache[tuple, BaseModel] = TTLCache(
+            maxsize=_RESPONSE_CACHE_SIZE, ttl=_RESPONSE_CACHE_TTL,
+        )
+
+    def _invalidate_user_cache(self, open_wearables_user_id: UUID) -> None:
+        """Drop cached responses for a user whose upstream data just changed."""
+        for key in [k for k in self._response_cache if k[0] == open_wearables_user_id]:
+            self._response_cache.pop(key, None)
 
     def _ensure_client_configured(self) -> None:
         """Ensure the Open Wearables client is configured, raise HTTP 503 if not."""
@@ -69,10 +213,31 @@ class WearablesService:
                 detail="Open Wearables integration is not configured. Contact administrator."
             )
 
-    def get_user_by_id(self, db: DbSession, user_id: UUID) -> User | None:
-        """Get user by ID."""
-        return db.query(User).filter(User.id == user_id).first()
+    async def get_user_by_id(self, db: DbSession, user_id: UUID) -> User | None:
+        """Get user by ID, running the blocking query in the threadpool."""
+        return await run_in_threadpool(db.get, User, user_id)
+
+    async def get_open_wearables_id_or_404(self, db: DbSession, user_id: UUID) -> UUID:
+        """Get user's Open Wearables ID with a single-column query.
+
+        Raises HTTP 404 if the user does not exist and HTTP 400 if the user
+        is not registered with Open Wearables yet.
+        """
+        stmt = select(User.open_wearables_user_id).where(User.id == user_id)
+        row = (await run_in_threadpool(db.execute, stmt)).one_or_none()
+        if row is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="User not found",
+            )
+        if row.open_wearables_user_id is None:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="User not registered with Open Wearables",
+            )
+        return row.open_wearables_user_id
 
+    @handle_upstream_errors("register with Open Wearables")
     async def register_user(
         self,
         db: DbSession,
@@ -85,12 +250,26 @@ class WearablesService:
                 already_registered=True
             )
         
-        updated_user = await user_service.register_with_open_wearables(db, user)
         return RegisterOpenWearablesResponse(
-            open_wearables_user_id=updated_user.open_wearables_user_id,  # type: ignore
-            already_registered=False
+            open_wearables_user_id=await self._register_or_409(db, user),
+            already_registered=False,
         )
 
+    async def _register_or_409(self, db: DbSession, user: User) -> UUID:
+        """Register user with Open Wearables and return the new ID.
+
+        Raises HTTP 409 when another worker holds this user's registration
+        lock (e.g. the background registration after first login).
+        """
+        updated_user = await user_service.register_with_open_wearables(db, user)
+        if updated_user.open_wearables_user_id is None:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="Registration with Open Wearables already in progress, retry shortly",
+            )
+        return updated_user.open_wearables_user_id
+
+    @handle_upstream_errors("fetch providers")
     async def get_providers(
         self,
         query_params: ProvidersQueryParams,
@@ -115,6 +294,7 @@ class WearablesService:
         
         return ProvidersResponse(providers=providers)
 
+    @handle_upstream_errors("get authorization URL")
     async def get_authorization_url(
         self,
         db: DbSession,
@@ -124,12 +304,11 @@ class WearablesService:
     ) -> AuthorizationResponse:
         """Get OAuth authorization URL for a provider."""
         # Ensure user is registered with Open Wearables
-        if not user.open_wearables_user_id:
-            user = await user_service.register_with_open_wearables(db, user)
+        open_wearables_user_id = user.open_wearables_user_id or await self._register_or_409(db, user)
         
         result = await self.client.get_authorization_url(
             provider=provider.lower(),
-            user_id=user.open_wearables_user_id,  # type: ignore
+            user_id=open_wearables_user_id,
             redirect_uri=redirect_uri
         )
         
@@ -138,45 +317,78 @@ class WearablesService:
             provider=provider
         )
 
+    @handle_upstream_errors("fetch connections")
     async def get_connections(
         self,
-        user: User,
+        open_wearables_user_id: UUID | None,
     ) -> ConnectionsResponse:
         """Get all wearable provider connections for a user."""
-        if not user.open_wearables_user_id:
+        if not open_wearables_user_id:
             return ConnectionsResponse(
                 connections=[],
                 open_wearables_user_id=None
             )
         
         connections_data = await self.client.get_user_connections(
-            user_id=user.open_wearables_user_id
+            user_id=open_wearables_user_id,
         )
         
+        # Pydantic parses the id; entries without one cannot be referenced and are skipped
         connections = [
             WearableConnection(
-                id=UUID(c.get("id", "")),
+                id=c["id"],
                 provider=c.get("provider", ""),
                 connected_at=c.get("connected_at"),
                 is_active=c.get("is_active", True),
                 last_sync=c.get("last_sync"),
             )
             for c in connections_data
+            if c.get("id")
         ]
         
         return ConnectionsResponse(
             connections=connections,
-            open_wearables_user_id=user.open_wearables_user_id
+            open_wearables_user_id=open_wearables_user_id,
+        )
+
+    @handle_upstream_errors("fetch providers and connections")
+    async def get_bootstrap(
+        self,
+        open_wearables_user_id: UUID | None,
+        query_params: ProvidersQueryParams,
+    ) -> BootstrapResponse:
+        """Fetch providers and user connections concurrently.
+
+        A failure in one call leaves its part empty instead of failing the
+        whole response; if both fail, the first error is raised.
+        """
+        providers, connections = await asyncio.gather(
+            self.get_providers(query_params),
+            self.get_connections(open_wearables_user_id),
+            return_exceptions=True,
         )
+        if isinstance(providers, BaseException) and isinstance(connections, BaseException):
+            raise providers
+
+        if isinstance(providers, BaseException):
+            self.log.warning("Bootstrap: failed to fetch providers: %s", providers)
+            providers = None
+        if isinstance(connections, BaseException):
+            self.log.warning("Bootstrap: failed to fetch connections: %s", connections)
+            connections = None
 
+        return BootstrapResponse(providers=providers, connections=connections)
+
+    @handle_upstream_errors("fetch timeseries")
+    @_cached_per_user
     async def get_timeseries(
         self,
-        user: User,
+        open_wearables_user_id: UUID | None,
         user_id: UUID,
         query_params: TimeseriesQueryParams,
     ) -> TimeseriesResponse:
         """Get time series data from Open Wearables."""
-        if not user.open_wearables_user_id:
+        if not open_wearables_user_id:
             return TimeseriesResponse(
                 data=[],
                 series_type=",".join(query_params.types),
@@ -185,42 +397,38 @@ class WearablesService:
             )
         
         result = await self.client.get_timeseries(
-            user_id=user.open_wearables_user_id,
-            start_time=query_params.start_time,
-            end_time=query_params.end_time,
+            user_id=open_wearables_user_id,
+            start_time=query_params.start_time.isoformat(),
+            end_time=query_params.end_time.isoformat(),
             types=query_params.types,
             limit=query_params.limit,
             resolution=query_params.resolution,
         )
         
-        items = result.get("data", [])
-        data_points = [
-            TimeseriesDataPoint(
-                timestamp=d.get("timestamp") or d.get("recorded_at"),
-                value=d.get("value", d.get("bpm", 0)),
-                unit=d.get("unit", "bpm"),
-            )
-            for d in items
-        ]
+        # Normalize to plain dicts and validate the whole response in one pass,
+        # rather than constructing thousands of data point models one by one
+        data_points = [_timeseries_point(d) for d in result.get("data", [])]
         
-        return TimeseriesResponse(
-            data=data_points,
-            series_type=",".join(query_params.types),
-            user_id=user_id,
-            count=len(data_points)
-        )
+        return TimeseriesResponse.model_validate({
+            "data": data_points,
+            "series_type": ",".join(query_params.types),
+            "user_id": user_id,
+            "count": len(data_points),
+        })
 
+    @handle_upstream_errors("sync data")
     async def sync_data(
         self,
-        user: User,
+        open_wearables_user_id: UUID,
         sync_request: SyncRequest,
     ) -> SyncResponse:
         """Trigger data synchronization from a wearable provider."""
         result = await self.client.sync_user_data(
-            user_id=user.open_wearables_user_id,  # type: ignore
+            user_id=open_wearables_user_id,
             provider=sync_request.provider,
             data_type=sync_request.data_type,
         )
+        self._invalidate_user_cache(open_wearables_user_id)
         
         return SyncResponse(
             status=result.get("status", "success"),
@@ -228,17 +436,19 @@ class WearablesService:
             synced_count=result.get("synced_count", 0),
         )
 
+    @handle_upstream_errors("fetch workouts")
+    @_cached_per_user
     async def get_workouts(
         self,
-        user: User,
+        open_wearables_user_id: UUID | None,
         limit: int = 50,
     ) -> WorkoutsResponse:
         """Get workouts from Open Wearables."""
-        if not user.open_wearables_user_id:
+        if not open_wearables_user_id:
             return WorkoutsResponse(workouts=[], total=0)
         
         workouts_data = await self.client.get_workouts(
-            user_id=user.open_wearables_user_id,
+            user_id=open_wearables_user_id,
             limit=limit,
         )
         
@@ -246,13 +456,14 @@ class WearablesService:
             Workout(
                 id=w.get("id"),
                 type=w.get("type"),
-                source_name=self._get_source_provider(w),
+                source_name=provider,
                 start_datetime=w.get("start_time") or w.get("start_datetime"),
                 end_datetime=w.get("end_time") or w.get("end_datetime"),
                 duration_seconds=w.get("duration_seconds"),
-                provider=self._get_source_provider(w),
+                provider=provider,
             )
             for w in workouts_data
+            for provider in (self._get_source_provider(w),)
         ]
         
         return WorkoutsResponse(
@@ -260,19 +471,21 @@ class WearablesService:
             total=len(workouts)
         )
 
+    @handle_upstream_errors("fetch workouts")
+    @_cached_per_user
     async def get_event_workouts(
         self,
-        user: User,
+        open_wearables_user_id: UUID | None,
         query_params: EventWorkoutsQueryParams,
     ) -> EventWorkoutsResponse:
         """Get rich workout events."""
-        if not user.open_wearables_user_id:
+        if not open_wearables_user_id:
             return EventWorkoutsResponse(data=[], has_more=False)
         
         result = await self.client.get_event_workouts(
-            user_id=user.open_wearables_user_id,
-            start_date=query_params.start_date,
-            end_date=query_params.end_date,
+            user_id=open_wearables_user_id,
+            start_date=query_params.start_date.isoformat(),
+            end_date=query_params.end_date.isoformat(),
             workout_type=query_params.workout_type,
             limit=query_params.limit,
         )
@@ -303,19 +516,21 @@ class WearablesService:
             next_cursor=pagination.get("next_cursor"),
         )
 
+    @handle_upstream_errors("fetch sleep sessions")
+    @_cached_per_user
     async def get_sleep_sessions(
         self,
-        user: User,
+        open_wearables_user_id: UUID | None,
         query_params: DateRangeQueryParams,
     ) -> SleepSessionsResponse:
         """Get sleep sessions with stage breakdown."""
-        if not user.open_wearables_user_id:
+        if not open_wearables_user_id:
             return SleepSessionsResponse(data=[], has_more=False)
         
         result = await self.client.get_sleep_sessions(
-            user_id=user.open_wearables_user_id,
-            start_date=query_params.start_date,
-            end_date=query_params.end_date,
+            user_id=open_wearables_user_id,
+            start_date=query_params.start_date.isoformat(),
+            end_date=query_params.end_date.isoformat(),
             limit=query_params.limit,
         )
         
@@ -340,19 +555,21 @@ class WearablesService:
             next_cursor=pagination.get("next_cursor"),
         )
 
+    @handle_upstream_errors("fetch activity summary")
+    @_cached_per_user
     async def get_activity_summary(
         self,
-        user: User,
+        open_wearables_user_id: UUID | None,
         query_params: DateRangeQueryParams,
     ) -> ActivitySummaryResponse:
         """Get daily activity summaries."""
-        if not user.open_wearables_user_id:
+        if not open_wearables_user_id:
             return ActivitySummaryResponse(data=[], has_more=False)
         
         result = await self.client.get_activity_summary(
-            user_id=user.open_wearables_user_id,
-            start_date=query_params.start_date,
-            end_date=query_params.end_date,
+            user_id=open_wearables_user_id,
+            start_date=query_params.start_date.isoformat(),
+            end_date=query_params.end_date.isoformat(),
             limit=query_params.limit,
         )
         
@@ -378,19 +595,21 @@ class WearablesService:
             next_cursor=pagination.get("next_cursor"),
         )
 
+    @handle_upstream_errors("fetch sleep summary")
+    @_cached_per_user
     async def get_sleep_summary(
         self,
-        user: User,
+        open_wearables_user_id: UUID | None,
         query_params: DateRangeQueryParams,
     ) -> SleepSummaryResponse:
         """Get daily sleep summaries."""
-        if not user.open_wearables_user_id:
+        if not open_wearables_user_id:
             return SleepSummaryResponse(data=[], has_more=False)
         
         result = await self.client.get_sleep_summary(
-            user_id=user.open_wearables_user_id,
-            start_date=query_params.start_date,
-            end_date=query_params.end_date,
+            user_id=open_wearables_user_id,
+            start_date=query_params.start_date.isoformat(),
+            end_date=query_params.end_date.isoformat(),
             limit=query_params.limit,
         )
         
@@ -420,19 +639,21 @@ class WearablesService:
             next_cursor=pagination.get("next_cursor"),
         )
 
+    @handle_upstream_errors("fetch recovery summary")
+    @_cached_per_user
     async def get_recovery_summary(
         self,
-        user: User,
+        open_wearables_user_id: UUID | None,
         query_params: DateRangeQueryParams,
     ) -> RecoverySummaryResponse:
         """Get daily recovery summaries."""
-        if not user.open_wearables_user_id:
+        if not open_wearables_user_id:
             return RecoverySummaryResponse(data=[], has_more=False)
         
         result = await self.client.get_recovery_summary(
-            user_id=user.open_wearables_user_id,
-            start_date=query_params.start_date,
-            end_date=query_params.end_date,
+            user_id=open_wearables_user_id,
+            start_date=query_params.start_date.isoformat(),
+            end_date=query_params.end_date.isoformat(),
             limit=query_params.limit,
         )
         
@@ -457,19 +678,21 @@ class WearablesService:
             next_cursor=pagination.get("next_cursor"),
         )
 
+    @handle_upstream_errors("fetch body summary")
+    @_cached_per_user
     async def get_body_summary(
         self,
-        user: User,
+        open_wearables_user_id: UUID | None,
         query_params: DateRangeQueryParams,
     ) -> BodySummaryResponse:
         """Get daily body metrics summaries."""
-        if not user.open_wearables_user_id:
+        if not open_wearables_user_id:
             return BodySummaryResponse(data=[], has_more=False)
         
         result = await self.client.get_body_summary(
-            user_id=user.open_wearables_user_id,
-            start_date=query_params.start_date,
-            end_date=query_params.end_date,
+            user_id=open_wearables_user_id,
+            start_date=query_params.start_date.isoformat(),
+            end_date=query_params.end_date.isoformat(),
             limit=query_params.limit,
         )
         
@@ -496,18 +719,46 @@ class WearablesService:
             next_cursor=pagination.get("next_cursor"),
         )
 
+    @handle_upstream_errors("fetch summaries")
+    async def get_all_summaries(
+        self,
+        open_wearables_user_id: UUID | None,
+        query_params: DateRangeQueryParams,
+    ) -> AllSummariesResponse:
+        """Fetch activity, sleep, recovery and body summaries concurrently.
+
+        A failed summary is left empty instead of failing the whole
+        response; if all of them fail, the first error is raised.
+        """
+        results = await asyncio.gather(
+            self.get_activity_summary(open_wearables_user_id, query_params),
+            self.get_sleep_summary(open_wearables_user_id, query_params),
+            self.get_recovery_summary(open_wearables_user_id, query_params),
+            self.get_body_summary(open_wearables_user_id, query_params),
+            return_exceptions=True,
+        )
+        errors = [r for r in results if isinstance(r, BaseException)]
+        if len(errors) == len(results):
+            raise errors[0]
+
+        parts = dict(zip(("activity", "sleep", "recovery", "body"), results, strict=True))
+        for name, result in parts.items():
+            if isinstance(result, BaseException):
+                self.log.warning("Summaries: failed to fetch %s summary: %s", name, result)
+                parts[name] = None
+
+        return AllSummariesResponse(**parts)
+
+    @handle_upstream_errors("fetch workout detail")
     async def get_workout_detail(
         self,
-        user: User,
+        open_wearables_user_id: UUID,
         provider: str,
         workout_id: str,
     ) -> WorkoutDetailResponse:
         """Get detailed data for a single workout."""
-        if not user.open_wearables_user_id:
-            raise ValueError("User not registered with Open Wearables")
-        
         result = await self.client.get_workout_detail(
-            user_id=user.open_wearables_user_id,
+            user_id=open_wearables_user_id,
             provider=provider,
             workout_id=workout_id,
         )
@@ -534,19 +785,18 @@ class WearablesService:
             training_effect_anaerobic=result.get("training_effect_anaerobic"),
         )
 
+    @handle_upstream_errors("import Apple Health data")
     async def import_apple_health_xml(
         self,
-        user: User,
+        open_wearables_user_id: UUID,
         file_key: str,
     ) -> AppleHealthImportResponse:
         """Import Apple Health XML export for a user."""
-        if not user.open_wearables_user_id:
-            raise ValueError("User not registered with Open Wearables")
-        
         result = await self.client.import_apple_health_xml(
-            user_id=user.open_wearables_user_id,
+            user_id=open_wearables_user_id,
             file_key=file_key,
         )
+        self._invalidate_user_cache(open_wearables_user_id)
         
         return AppleHealthImportResponse(
             status=result.get("status", "success"),
@@ -558,82 +808,7 @@ class WearablesService:
 
     def get_available_series_types(self) -> AvailableSeriesTypesResponse:
         """Get list of all available timeseries types."""
-        # Define categories and units for series types
-        type_info = {
-            # Heart & Cardiovascular
-            SeriesType.HEART_RATE: ("Heart Rate", "bpm", "cardiovascular"),
-            SeriesType.RESTING_HEART_RATE: ("Resting Heart Rate", "bpm", "cardiovascular"),
-            SeriesType.HEART_RATE_VARIABILITY_SDNN: ("Heart Rate Variability (SDNN)", "ms", "cardiovascular"),
-            SeriesType.HEART_RATE_RECOVERY_ONE_MINUTE: ("Heart Rate Recovery (1 min)", "bpm", "cardiovascular"),
-            SeriesType.WALKING_HEART_RATE_AVERAGE: ("Walking Heart Rate Average", "bpm", "cardiovascular"),
-            # Blood & Oxygen
-            SeriesType.OXYGEN_SATURATION: ("Blood Oxygen Saturation", "%", "blood"),
-            SeriesType.BLOOD_GLUCOSE: ("Blood Glucose", "mg/dL", "blood"),
-            SeriesType.BLOOD_PRESSURE_SYSTOLIC: ("Blood Pressure (Systolic)", "mmHg", "blood"),
-            SeriesType.BLOOD_PRESSURE_DIASTOLIC: ("Blood Pressure (Diastolic)", "mmHg", "blood"),
-            # Respiratory
-            SeriesType.RESPIRATORY_RATE: ("Respiratory Rate", "breaths/min", "respiratory"),
-            SeriesType.SLEEPING_BREATHING_DISTURBANCES: ("Sleep Breathing Disturbances", "events/hr", "respiratory"),
-            # Body Metrics
-            SeriesType.HEIGHT: ("Height", "cm", "body"),
-            SeriesType.WEIGHT: ("Weight", "kg", "body"),
-            SeriesType.BODY_FAT_PERCENTAGE: ("Body Fat Percentage", "%", "body"),
-            SeriesType.BODY_MASS_INDEX: ("Body Mass Index (BMI)", "kg/m²", "body"),
-            SeriesType.LEAN_BODY_MASS: ("Lean Body Mass", "kg", "body"),
-            SeriesType.BODY_TEMPERATURE: ("Body Temperature", "°C", "body"),
-            # Fitness
-            SeriesType.VO2_MAX: ("VO2 Max", "mL/kg/min", "fitness"),
-            SeriesType.SIX_MINUTE_WALK_TEST_DISTANCE: ("6-Minute Walk Test Distance", "m", "fitness"),
-            # Activity
-            SeriesType.STEPS: ("Steps", "count", "activity"),
-            SeriesType.ENERGY: ("Active Energy", "kcal", "activity"),
-            SeriesType.BASAL_ENERGY: ("Basal Energy", "kcal", "activity"),
-            SeriesType.STAND_TIME: ("Stand Time", "min", "activity"),
-            SeriesType.EXERCISE_TIME: ("Exercise Time", "min", "activity"),
-            SeriesType.PHYSICAL_EFFORT: ("Physical Effort", "MET", "activity"),
-            SeriesType.FLIGHTS_CLIMBED: ("Flights Climbed", "count", "activity"),
-            # Distance
-            SeriesType.DISTANCE_WALKING_RUNNING: ("Walking + Running Distance", "km", "distance"),
-            SeriesType.DISTANCE_CYCLING: ("Cycling Distance", "km", "distance"),
-            SeriesType.DISTANCE_SWIMMING: ("Swimming Distance", "m", "distance"),
-            SeriesType.DISTANCE_DOWNHILL_SNOW_SPORTS: ("Downhill Snow Sports Distance", "km", "distance"),
-            # Walking Metrics
-            SeriesType.WALKING_STEP_LENGTH: ("Walking Step Length", "cm", "walking"),
-            SeriesType.WALKING_SPEED: ("Walking Speed", "km/h", "walking"),
-            SeriesType.WALKING_DOUBLE_SUPPORT_PERCENTAGE: ("Double Support Time", "%", "walking"),
-            SeriesType.WALKING_ASYMMETRY_PERCENTAGE: ("Walking Asymmetry", "%", "walking"),
-            SeriesType.WALKING_STEADINESS: ("Walking Steadiness", "%", "walking"),
-            SeriesType.STAIR_DESCENT_SPEED: ("Stair Descent Speed", "m/s", "walking"),
-            SeriesType.STAIR_ASCENT_SPEED: ("Stair Ascent Speed", "m/s", "walking"),
-            # Running Metrics
-            SeriesType.RUNNING_POWER: ("Running Power", "W", "running"),
-            SeriesType.RUNNING_SPEED: ("Running Speed", "km/h", "running"),
-            SeriesType.RUNNING_VERTICAL_OSCILLATION: ("Vertical Oscillation", "cm", "running"),
-            SeriesType.RUNNING_GROUND_CONTACT_TIME: ("Ground Contact Time", "ms", "running"),
-            SeriesType.RUNNING_STRIDE_LENGTH: ("Running Stride Length", "m", "running"),
-            # Swimming & Cycling
-            SeriesType.SWIMMING_STROKE_COUNT: ("Swimming Stroke Count", "count", "swimming"),
-            SeriesType.CADENCE: ("Cadence", "rpm", "cycling"),
-            SeriesType.POWER: ("Power", "W", "cycling"),
-            # Environment
-            SeriesType.ENVIRONMENTAL_AUDIO_EXPOSURE: ("Environmental Audio Exposure", "dB", "environment"),
-            SeriesType.HEADPHONE_AUDIO_EXPOSURE: ("Headphone Audio Exposure", "dB", "environment"),
-            SeriesType.ENVIRONMENTAL_SOUND_REDUCTION: ("Sound Reduction", "dB", "environment"),
-            SeriesType.TIME_IN_DAYLIGHT: ("Time in Daylight", "min", "environment"),
-            SeriesType.WATER_TEMPERATURE: ("Water Temperature", "°C", "environment"),
-        }
-        
-        types = []
-        for series_type in SeriesType:
-            info = type_info.get(series_type, (series_type.value.replace("_", " ").title(), None, None))
-            types.append(SeriesTypeInfo(
-                name=series_type.value,
-                description=info[0],
-                unit=info[1],
-                category=info[2],
-            ))
-        
-        return AvailableSeriesTypesResponse(types=types, total=len(types))
+        return _AVAILABLE_SERIES_TYPES
 
     # ============================================
     # Helper Methods
@@ -648,10 +823,12 @@ class WearablesService:
 
     def _build_data_source(self, data: dict) -> DataSource:
         """Build DataSource from API response data."""
-        source = data.get("source", {})
+        source = data.get("source")
+        if not isinstance(source, dict):
+            return DataSource(provider="unknown")
         return DataSource(
-            provider=source.get("provider", "unknown") if isinstance(source, dict) else "unknown",
-            device=source.get("device") if isinstance(source, dict) else None,
+            provider=source.get("provider") or "unknown",
+            device=source.get("device"),
         )
 
     def _build_sleep_stages(self, stages: dict | None) -> SleepStages | None:
@@ -1,8 +1,12 @@
-from collections.abc import Callable
+from collections.abc import Callable, Coroutine
 from functools import wraps
+from typing import Any
 
+import orjson
+from fastapi import Request, Response
 from fastapi.encoders import jsonable_encoder
 from fastapi.responses import JSONResponse
+from fastapi.routing import APIRoute
 
 from app.utils.hateoas import get_hateoas_item, get_hateoas_list
 
@@ -28,3 +32,24 @@ def format_response(extra_rels: list[dict] = [], status_code: int = 200) -> Call
         return wrapper
 
     return decorator
+
+
+class ORJSONRequest(Request):
+    """Request that decodes JSON bodies with orjson."""
+
+    async def json(self) -> Any:
+        if not hasattr(self, "_json"):
+            self._json = orjson.loads(await self.body())
+        return self._json
+
+
+class ORJSONRoute(APIRoute):
+    """Route that hands its endpoint an ORJSONRequest, so request bodies are parsed with orjson."""
+
+    def get_route_handler(self) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+        route_handler = super().get_route_handler()
+
+        async def orjson_route_handler(request: Request) -> Response:
+            return await route_handler(ORJSONRequest(request.scope, request.receive))
+
+        return orjson_route_handler
@@ -1,24 +1,67 @@
+from hashlib import sha256
 from logging import getLogger
+from time import time
 from typing import Annotated
+from uuid import UUID
 
-from fastapi import Depends
+from cachetools import TTLCache
+from fastapi import BackgroundTasks, Depends
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from starlette.concurrency import run_in_threadpool
 
-from app.services import auth0_service
-from app.database import DbSession
-from app.services import user_service
-from app.services.open_wearables_client import OpenWearablesConfigurationError
+from app.database import DbSession, SessionLocal
+from app.models import User
 from app.schemas import UserInfo
+from app.services import auth0_service, user_service
+from app.services.open_wearables_client import OpenWearablesConfigurationError
 
 security = HTTPBearer()
 logger = getLogger(__name__)
 
+# Resolved users keyed by token hash: repeat requests with the same token skip
+# verification, the userinfo call and the DB. This is the only cache of user
+# data; a miss reads (or upserts) the user row. Only registered users are
+# cached, so registration is still retried for the others.
+#
+# Invalidation: entries are never invalidated explicitly. They are bounded by
+# the TTL and by the token's own exp, which is rechecked on every hit. A token
+# revoked at Auth0, or an email changed there, therefore stays accepted with
+# the old data for up to the TTL; JWTs are not checked against revocation
+# anyway. A new token always misses, so its email reaches the DB at once.
+_user_info_cache: TTLCache[str, UserInfo] = TTLCache(maxsize=10_000, ttl=300)
+
+
+async def _register_with_open_wearables(user_id: UUID) -> None:
+    """Register a user with Open Wearables in its own session (background task)."""
+    db = SessionLocal()
+    try:
+        user = await run_in_threadpool(db.get, User, user_id)
+        if user and not user.open_wearables_user_id:
+            await user_service.register_with_open_wearables(db, user)
+    except OpenWearablesConfigurationError as e:
+        # Configuration error - log as error since this needs to be fixed
+        logger.error(
+            f"Open Wearables not configured: {e}. "
+            "Set OPEN_WEARABLES_API_KEY environment variable.",
+        )
+    except Exception as e:
+        # Other errors (network, API errors) - log as warning
+        logger.warning(f"Failed to register user with Open Wearables: {e}")
+    finally:
+        await run_in_threadpool(db.close)
+
 
 async def get_current_user(
     credentials: Annotated[HTTPAuthorizationCredentials, Depends(security)],
-    db: DbSession
+    db: DbSession,
+    background_tasks: BackgroundTasks,
 ) -> UserInfo:
     token = credentials.credentials
+    token_hash = sha256(token.encode()).hexdigest()
+    cached_info = _user_info_cache.get(token_hash)
+    if cached_info is not None and cached_info.payload.get("exp", 0) > time():
+        return cached_info
+
     payload = await auth0_service.verify_token(token)
     
     auth0_id = auth0_service.get_user_id(payload)
@@ -32,36 +75,34 @@ async def get_current_user(
         except Exception:
             email = f"{auth0_id}@unknown.com"  # Fallback
     
-    user = user_service.get_or_create_user(
+    email = email or f"{auth0_id}@unknown.com"
+    # Blocking DB work runs in the threadpool so it does not stall the event loop
+    user = await run_in_threadpool(
+        user_service.get_or_create_user,
         db,
         auth0_id=auth0_id,
-        email=email or f"{auth0_id}@unknown.com"
+        email=email,
     )
     
-    # Auto-register with Open Wearables if not already registered
+    # Register with Open Wearables after the response is sent, off the auth path
     if not user.open_wearables_user_id:
-        try:
-            user = await user_service.register_with_open_wearables(db, user)
-        except OpenWearablesConfigurationError as e:
-            # Configuration error - log as error since this needs to be fixed
-            logger.error(
-                f"Open Wearables not configured: {e}. "
-                "Set OPEN_WEARABLES_API_KEY environment variable."
-            )
-        except Exception as e:
-            # Other errors (network, API errors) - log as warning
-            logger.warning(f"Failed to register user with Open Wearables: {e}")
+        background_tasks.add_task(_register_with_open_wearables, user.id)
     
-    return UserInfo(
+    user_info = UserInfo(
         user_id=user.id,
         auth0_id=auth0_id,
-        email=str(user.email),
+        email=user.email,
+        open_wearables_user_id=user.open_wearables_user_id,
         permissions=permissions,
         payload=payload
     )
+    if user_info.open_wearables_user_id:
+        _user_info_cache[token_hash] = user_info
+    return user_info
+
+
+CurrentUser = Annotated[UserInfo, Depends(get_current_user)]
 
 
-async def get_current_user_id(
-    current_user: Annotated[UserInfo, Depends(get_current_user)]
-) -> str:
+async def get_current_user_id(current_user: CurrentUser) -> str:
     return str(current_user.user_id)
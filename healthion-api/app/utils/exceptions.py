@@ -1,5 +1,5 @@
 import asyncio
-from collections.abc import Callable
+from collections.abc import Awaitable, Callable
 from functools import singledispatch, wraps
 from typing import TYPE_CHECKING
 from uuid import UUID
@@ -11,6 +11,7 @@ from jose import JWTError
 from jose.exceptions import ExpiredSignatureError
 from psycopg.errors import IntegrityError as PsycopgIntegrityError
 from sqlalchemy.exc import IntegrityError as SQLAIntegrityError
+from sqlalchemy.orm.exc import StaleDataError
 
 if TYPE_CHECKING:
     from app.services import AppService
@@ -25,6 +26,15 @@ class ResourceNotFoundError(Exception):
             self.detail = f"{entity_name.capitalize()} not found."
 
 
+class UpstreamError(Exception):
+    """Raised when a call to an upstream service (Open Wearables) fails."""
+
+    def __init__(self, op: str, inner: BaseException):
+        super().__init__(op, inner)
+        self.op = op
+        self.inner = inner
+
+
 @singledispatch
 def handle_exception(exc: Exception, _: str) -> HTTPException:
     raise exc
@@ -38,11 +48,27 @@ def _(exc: SQLAIntegrityError | PsycopgIntegrityError, entity: str) -> HTTPExcep
     )
 
 
+@handle_exception.register
+def _(exc: StaleDataError, entity: str) -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_409_CONFLICT,
+        detail=f"{entity.capitalize()} was modified concurrently. Please, retry.",
+    )
+
+
 @handle_exception.register
 def _(exc: ResourceNotFoundError, _: str) -> HTTPException:
     return HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=exc.detail)
 
 
+@handle_exception.register
+def _(exc: UpstreamError, _: str) -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_502_BAD_GATEWAY,
+        detail={"op": exc.op, "error": type(exc.inner).__name__, "msg": str(exc.inner)},
+    )
+
+
 @handle_exception.register
 def _(exc: AttributeError, entity: str) -> HTTPException:
     return HTTPException(
@@ -102,3 +128,25 @@ def handle_exceptions[**P, T, Service: AppService](func: Callable[P, T]) -> Call
             raise handle_exception(exc, entity_name) from exc
 
     return async_wrapper
+
+
+def handle_upstream_errors[**P, T](
+    op: str,
+) -> Callable[[Callable[P, Awaitable[T]]], Callable[P, Awaitable[T]]]:
+    """Re-raise unexpected errors of an upstream call as UpstreamError(op, ...).
+
+    HTTPExceptions and already wrapped errors pass through unchanged.
+    """
+    def decorator(func: Callable[P, Awaitable[T]]) -> Callable[P, Awaitable[T]]:
+        @wraps(func)
+        async def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
+            try:
+                return await func(*args, **kwargs)
+            except (HTTPException, UpstreamError):
+                raise
+            except Exception as exc:
+                raise UpstreamError(op, exc) from exc
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,37 @@
+"""
+Gunicorn configuration for running the API in production.
+
+Usage: gunicorn app.main:api -c gunicorn_conf.py
+"""
+
+import os
+
+from gunicorn.arbiter import Arbiter
+from gunicorn.workers.base import Worker
+
+bind = os.getenv("BIND", "0.0.0.0:8000")
+
+# One async Uvicorn worker per core this process may run on (honours cpusets and
+# taskset, unlike os.cpu_count()); set WEB_CONCURRENCY under a CPU quota. Each
+# worker has its own DB pool, so workers * (DB_POOL_SIZE + DB_MAX_OVERFLOW) must
+# stay below Postgres max_connections (100 by default).
+workers = int(os.getenv("WEB_CONCURRENCY", len(os.sched_getaffinity(0))))
+# Picks uvloop + httptools automatically (installed with uvicorn[standard])
+worker_class = "uvicorn_worker.UvicornWorker"
+
+# Import the app once in the master so workers fork with it already loaded
+preload_app = True
+
+keepalive = int(os.getenv("KEEPALIVE", 5))
+timeout = int(os.getenv("TIMEOUT", 120))
+graceful_timeout = int(os.getenv("GRACEFUL_TIMEOUT", 30))
+
+accesslog = "-"
+errorlog = "-"
+
+
+def post_fork(server: Arbiter, worker: Worker) -> None:
+    # Connections opened by the master must not be shared with forked workers
+    from app.database import engine
+
+    engine.dispose(close=False)
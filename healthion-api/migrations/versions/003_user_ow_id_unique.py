@@ -0,0 +1,91 @@
+"""Make open_wearables_user_id unique among registered users
+
+Revision ID: 003_user_ow_id_unique
+Revises: 002_user_version
+Create Date: 2026-10-15
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '003_user_ow_id_unique'
+down_revision: Union[str, None] = '002_user_version'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _index_valid(name: str) -> bool | None:
+    """Whether the index is valid, or None if it does not exist."""
+    return op.get_bind().execute(
+        sa.text(
+            "SELECT i.indisvalid FROM pg_index i JOIN pg_class c ON c.oid = i.indexrelid "
+            "WHERE c.relname = :name",
+        ),
+        {"name": name},
+    ).scalar_one_or_none()
+
+
+def upgrade() -> None:
+    duplicates = op.get_bind().execute(
+        sa.text(
+            'SELECT open_wearables_user_id FROM "user" WHERE open_wearables_user_id IS NOT NULL '
+            "GROUP BY open_wearables_user_id HAVING count(*) > 1 LIMIT 5",
+        ),
+    ).scalars().all()
+    if duplicates:
+        raise RuntimeError(
+            f"Users share an Open Wearables id ({', '.join(map(str, duplicates))}); "
+            "resolve the duplicates before making open_wearables_user_id unique",
+        )
+
+    # Each Open Wearables user belongs to one account; the unique index replaces
+    # the plain one, so lookups keep an index and writes maintain only one.
+    # Unregistered users are left out of it, and equality lookups imply the predicate.
+    # Built concurrently so signups aren't blocked, which can't run in a transaction.
+    with op.get_context().autocommit_block():
+        # A failed or cancelled concurrent build leaves an INVALID index behind
+        if _index_valid('uq_user_open_wearables_user_id') is False:
+            op.drop_index(
+                op.f('uq_user_open_wearables_user_id'),
+                table_name='user',
+                postgresql_concurrently=True,
+            )
+        op.create_index(
+            op.f('uq_user_open_wearables_user_id'),
+            'user',
+            ['open_wearables_user_id'],
+            unique=True,
+            postgresql_where=sa.text('open_wearables_user_id IS NOT NULL'),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        # Only give up the old index once its replacement is usable
+        if not _index_valid('uq_user_open_wearables_user_id'):
+            raise RuntimeError("uq_user_open_wearables_user_id was not built; the old index is kept")
+        op.drop_index(
+            op.f('ix_user_open_wearables_user_id'),
+            table_name='user',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            op.f('ix_user_open_wearables_user_id'),
+            'user',
+            ['open_wearables_user_id'],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            op.f('uq_user_open_wearables_user_id'),
+            table_name='user',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
@@ -0,0 +1,31 @@
+"""Add server-side defaults for user id and timestamps
+
+Revision ID: 004_user_server_defaults
+Revises: 003_user_ow_id_unique
+Create Date: 2026-10-15
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '004_user_server_defaults'
+down_revision: Union[str, None] = '003_user_ow_id_unique'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Lets SQL-side inserts (data fixes, INSERT ... SELECT) omit these columns;
+    # only the catalog changes, existing rows are not rewritten
+    op.alter_column('user', 'id', server_default=sa.text('gen_random_uuid()'))
+    op.alter_column('user', 'created_at', server_default=sa.func.now())
+    op.alter_column('user', 'updated_at', server_default=sa.func.now())
+
+
+def downgrade() -> None:
+    op.alter_column('user', 'updated_at', server_default=None)
+    op.alter_column('user', 'created_at', server_default=None)
+    op.alter_column('user', 'id', server_default=None)
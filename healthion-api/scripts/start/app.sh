@@ -10,5 +10,5 @@ echo "Starting the FastAPI application..."
 if [ "$DEBUG" = "True" ]; then
     uv run fastapi dev app/main.py --host 0.0.0.0 --port 8000
 else
-    uv run fastapi run app/main.py --host 0.0.0.0 --port 8000
+    uv run gunicorn app.main:api -c gunicorn_conf.py
 fi